@@ -0,0 +1,20 @@
+"""
+Small filesystem helpers shared by the root-level test scripts.
+
+Existence checks go through access(F_OK), which skips filling in a stat
+result; callers that also need the size or mtime should use stat_or_none
+so each file costs a single stat call.
+"""
+
+import os
+
+def exists(path) -> bool:
+    """Return True if path exists (file or directory)."""
+    return os.access(path, os.F_OK)
+
+def stat_or_none(path):
+    """Return os.stat(path), or None if it can't be stat'ed."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
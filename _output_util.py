@@ -0,0 +1,36 @@
+"""
+Output helpers shared by the root-level test scripts.
+"""
+
+import io
+import sys
+import functools
+import contextlib
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it in one go.
+    
+    Also usable as a decorator. Keeps each test's report contiguous when
+    tests run in parallel and avoids a flush per print on line-buffered
+    terminals. The buffer is written even if the block raises.
+    """
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield buf
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+def buffered_stdout_async(func):
+    """Decorator form of buffered_stdout for coroutine functions.
+    
+    Using buffered_stdout() directly as a decorator on an async def would only
+    buffer creating the coroutine, not running it.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with buffered_stdout():
+            return await func(*args, **kwargs)
+    return wrapper
@@ -9,18 +9,24 @@ import sys
 import asyncio
 import time
 import json
-import random
-from typing import Dict, Any, Optional, List
+import threading
+import functools
+import contextlib
+import importlib.util
+import hashlib
+import itertools
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 from pathlib import Path
-import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from datetime import datetime
 import uuid
 import logging
-import requests
+import orjson
+import numpy as np
 
 # Add src to path for imports
 sys.path.append('src')
@@ -38,8 +44,234 @@ video_generator = None
 CAN_IMPORT_DEPENDENCIES = False
 DEPENDENCY_ERROR = None
 
+class TaskStore:
+    """Thread-safe, bounded task map split into independently locked shards.
+    
+    Lookups are plain dict reads; writers only lock the shard that owns the
+    task, so concurrent status polls and progress updates rarely contend.
+    Each shard keeps tasks in insertion order and drops its oldest entries
+    once it holds more than its share of max_size. Tasks older than ttl
+    seconds are treated as gone and removed on access or by evict_expired().
+    
+    A bounded deque of task ids in creation order lets recent_ids() list the
+    newest tasks without scanning or sorting the whole store.
+    
+    Coroutines can subscribe() to a task to be woken whenever it changes.
+    The JSON encoding of each task is cached until the task is next modified.
+    """
+    
+    def __init__(self, max_size: int = 1000, ttl: float = 3600, num_shards: int = 16):
+        # num_shards must be a power of two so a bitmask picks the shard
+        self._mask = num_shards - 1
+        self._shard_size = max(1, -(-max_size // num_shards))
+        self.ttl = ttl
+        self._shards: List[OrderedDict] = [OrderedDict() for _ in range(num_shards)]
+        # Monotonic creation time per task, kept out of the task payload
+        self._created: List[Dict[str, float]] = [{} for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+        # task_id -> orjson-encoded task, dropped whenever the task changes
+        self._encoded: List[Dict[str, bytes]] = [{} for _ in range(num_shards)]
+        # task_id -> [(loop, event)] for coroutines waiting on task updates
+        self._watchers: List[Dict[str, list]] = [{} for _ in range(num_shards)]
+        self._recent = deque(maxlen=max_size)
+        self._recent_lock = threading.Lock()
+    
+    def _index(self, task_id: str) -> int:
+        return hash(task_id) & self._mask
+    
+    def _is_expired(self, i: int, task_id: str, now: float) -> bool:
+        created = self._created[i].get(task_id)
+        return created is not None and now - created > self.ttl
+    
+    def _notify(self, i: int, task_id: str):
+        # Caller must hold self._locks[i]; events may belong to another thread's loop
+        for loop, event in self._watchers[i].get(task_id, ()):
+            loop.call_soon_threadsafe(event.set)
+    
+    def _pop(self, i: int, task_id: str) -> Optional[Dict[str, Any]]:
+        # Caller must hold self._locks[i]
+        self._created[i].pop(task_id, None)
+        self._encoded[i].pop(task_id, None)
+        self._notify(i, task_id)
+        return self._shards[i].pop(task_id, None)
+    
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Return the task dict, or None if unknown or expired."""
+        i = self._index(task_id)
+        task = self._shards[i].get(task_id)
+        if task is not None and self._is_expired(i, task_id, time.monotonic()):
+            with self._locks[i]:
+                self._pop(i, task_id)
+            return None
+        return task
+    
+    def set(self, task_id: str, task: Dict[str, Any]):
+        """Insert or replace a task, evicting the shard's oldest tasks if full."""
+        i = self._index(task_id)
+        shard = self._shards[i]
+        with self._locks[i]:
+            if task_id not in shard:
+                with self._recent_lock:
+                    self._recent.append(task_id)
+            shard[task_id] = task
+            shard.move_to_end(task_id)
+            self._encoded[i].pop(task_id, None)
+            self._created[i][task_id] = time.monotonic()
+            while len(shard) > self._shard_size:
+                self._pop(i, next(iter(shard)))
+    
+    def update_fields(self, task_id: str, **fields) -> bool:
+        """Update fields of an existing task. Returns False if the task is unknown."""
+        i = self._index(task_id)
+        with self._locks[i]:
+            task = self._shards[i].get(task_id)
+            if task is None:
+                return False
+            task.update(fields)
+            self._encoded[i].pop(task_id, None)
+            self._notify(i, task_id)
+            return True
+    
+    def recent_ids(self, limit: int, status: Optional[str] = None) -> List[str]:
+        """Return ids of the newest live tasks (newest first), optionally filtered by status."""
+        # Copy under the lock, then look tasks up without it: set() takes the
+        # shard lock before _recent_lock, so get() must not run while holding it
+        with self._recent_lock:
+            snapshot = list(self._recent)
+        ids = []
+        for task_id in reversed(snapshot):
+            if len(ids) >= limit:
+                break
+            task = self.get(task_id)
+            if task is not None and (status is None or task["status"] == status):
+                ids.append(task_id)
+        return ids
+    
+    def get_encoded(self, task_id: str) -> Optional[bytes]:
+        """Return the task serialized as JSON bytes, or None if unknown."""
+        i = self._index(task_id)
+        with self._locks[i]:
+            blob = self._encoded[i].get(task_id)
+            if blob is None:
+                task = self._shards[i].get(task_id)
+                if task is None:
+                    return None
+                blob = orjson.dumps(task)
+                self._encoded[i][task_id] = blob
+            return blob
+    
+    def subscribe(self, task_id: str) -> asyncio.Event:
+        """Return an event that is set whenever the task is updated or removed."""
+        event = asyncio.Event()
+        i = self._index(task_id)
+        with self._locks[i]:
+            self._watchers[i].setdefault(task_id, []).append((asyncio.get_running_loop(), event))
+        return event
+    
+    def unsubscribe(self, task_id: str, event: asyncio.Event):
+        """Stop delivering updates to an event returned by subscribe()."""
+        i = self._index(task_id)
+        with self._locks[i]:
+            watchers = self._watchers[i].get(task_id, [])
+            watchers[:] = [w for w in watchers if w[1] is not event]
+            if not watchers:
+                self._watchers[i].pop(task_id, None)
+    
+    def delete(self, task_id: str) -> bool:
+        """Remove a task. Returns False if the task is unknown."""
+        i = self._index(task_id)
+        with self._locks[i]:
+            return self._pop(i, task_id) is not None
+    
+    def clear(self) -> int:
+        """Remove all tasks and return how many were removed."""
+        count = 0
+        for i, lock in enumerate(self._locks):
+            with lock:
+                count += len(self._shards[i])
+                self._shards[i].clear()
+                self._created[i].clear()
+                self._encoded[i].clear()
+                # Wake open streams so they see their task is gone and finish
+                for task_id in self._watchers[i]:
+                    self._notify(i, task_id)
+        with self._recent_lock:
+            self._recent.clear()
+        return count
+    
+    def evict_expired(self) -> int:
+        """Remove all tasks older than ttl and return how many were removed."""
+        now = time.monotonic()
+        count = 0
+        for i, lock in enumerate(self._locks):
+            with lock:
+                expired = [tid for tid in self._shards[i] if self._is_expired(i, tid, now)]
+                for tid in expired:
+                    self._pop(i, tid)
+                count += len(expired)
+        return count
+    
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return shallow copies of all unexpired tasks."""
+        now = time.monotonic()
+        tasks = []
+        for i, lock in enumerate(self._locks):
+            with lock:
+                tasks.extend(
+                    dict(task) for tid, task in self._shards[i].items()
+                    if not self._is_expired(i, tid, now)
+                )
+        return tasks
+    
+    def __contains__(self, task_id: str) -> bool:
+        return self.get(task_id) is not None
+    
+    def __len__(self) -> int:
+        """Number of unexpired tasks (expired ones may not have been swept yet)."""
+        now = time.monotonic()
+        count = 0
+        for i, lock in enumerate(self._locks):
+            with lock:
+                count += sum(1 for tid in self._shards[i] if not self._is_expired(i, tid, now))
+        return count
+
 # Global task storage (in production, use Redis or database)
-task_storage = {}
+task_store = TaskStore(
+    max_size=int(os.getenv("TASK_STORE_MAX_SIZE", 1000)),
+    ttl=float(os.getenv("TASK_STORE_TTL", 3600))
+)
+TASK_SWEEP_INTERVAL = 60  # seconds between expired-task sweeps
+_sweeper_task: Optional[asyncio.Task] = None
+MAX_LIST_LIMIT = 100  # upper bound on tasks returned by /api/tasks
+TERMINAL_STATUSES = ("completed", "failed")
+
+# Request fingerprint -> task_id of the generation currently running for it
+in_flight_tasks: Dict[str, str] = {}
+SSE_KEEPALIVE_INTERVAL = 15  # seconds between keep-alive comments on idle streams
+_DELAY_RNG = np.random.default_rng()  # demo stage pacing
+_iso_cache: Tuple[int, str] = (0, "")
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second."""
+    global _iso_cache
+    now = int(time.time())
+    cached = _iso_cache
+    if cached[0] != now:
+        cached = (now, datetime.fromtimestamp(now).isoformat())
+        _iso_cache = cached
+    return cached[1]
+
+# Task ids: random per-process prefix + pid + counter, unique across workers
+_node_prefix = uuid.uuid4().hex[:8]
+_task_counter = itertools.count()
+
+def _new_task_id() -> str:
+    """Return a short, monotonically increasing task id (20 hex chars).
+
+    The pid is masked to 16 bits so ids keep a fixed width on systems where
+    pid_max exceeds 65535; the random prefix keeps workers apart.
+    """
+    return f"{_node_prefix}{os.getpid() & 0xffff:04x}{next(_task_counter):08x}"
 
 # Pydantic models for API
 class VideoGenerationRequest(BaseModel):
@@ -65,6 +297,15 @@ class TaskStatus(BaseModel):
     error: Optional[str] = None
     video_id: Optional[str] = None  # Add video_id for Appwrite subscriptions
     created_at: str
+    finished_at: Optional[str] = None
+
+class TaskProgress(BaseModel):
+    """Lightweight status projection for frequent polling."""
+    status: str
+    progress: int
+    message: str
+    video_id: Optional[str] = None
+    finished_at: Optional[str] = None
 
 class HealthResponse(BaseModel):
     status: str
@@ -73,22 +314,29 @@ class HealthResponse(BaseModel):
     timestamp: str
     version: str = "1.0.0"
 
-def check_dependencies():
-    """Check if required dependencies are available."""
-    global CAN_IMPORT_DEPENDENCIES, DEPENDENCY_ERROR
+class DependencyStatus(NamedTuple):
+    ok: bool
+    missing: Tuple[str, ...]
+    err: Optional[str]
+
+@functools.lru_cache(maxsize=1)
+def check_dependencies() -> DependencyStatus:
+    """Check if required dependencies are available.
     
+    The probe runs once per process; later calls return the cached result.
+    """
     missing_deps = []
+    err = None
     
-    try:
-        import manim
-    except ImportError:
+    # Presence check only - no need to execute manim's package init here
+    if importlib.util.find_spec("manim") is None:
         missing_deps.append("manim")
     
     try:
         from generate_video import VideoGenerator
     except ImportError as e:
         missing_deps.append("generate_video")
-        DEPENDENCY_ERROR = str(e)
+        err = str(e)
     
     try:
         from mllm_tools.litellm import LiteLLMWrapper
@@ -96,16 +344,15 @@ def check_dependencies():
         missing_deps.append("mllm_tools")
     
     if missing_deps:
-        CAN_IMPORT_DEPENDENCIES = False
         logger.warning(f"Missing dependencies: {', '.join(missing_deps)}")
-        return False
     else:
-        CAN_IMPORT_DEPENDENCIES = True
         logger.info("All dependencies available")
-        return True
+    return DependencyStatus(not missing_deps, tuple(missing_deps), err)
 
 def setup_environment():
     """Setup environment for API server."""
+    global CAN_IMPORT_DEPENDENCIES, DEPENDENCY_ERROR
+    
     logger.info("🚀 Setting up manimAnimationAgent API Server...")
     
     # Create output directory
@@ -113,6 +360,8 @@ def setup_environment():
     
     # Check dependencies
     dep_status = check_dependencies()
+    CAN_IMPORT_DEPENDENCIES = dep_status.ok
+    DEPENDENCY_ERROR = dep_status.err
     
     gemini_keys = os.getenv("GEMINI_API_KEY", "")
     if gemini_keys:
@@ -127,6 +376,10 @@ def initialize_video_generator():
     """Initialize video generator with proper dependencies."""
     global video_generator, CAN_IMPORT_DEPENDENCIES, DEPENDENCY_ERROR
     
+    # Reuse the existing generator (and its model clients) on repeat calls
+    if video_generator is not None:
+        return "✅ Video generator already initialized"
+    
     try:
         if DEMO_MODE:
             logger.info("⚠️ Demo mode enabled - No video generation")
@@ -173,8 +426,12 @@ def initialize_video_generator():
         logger.error(f"❌ Error initializing video generator: {e}")
         return f"❌ Initialization failed: {str(e)}"
 
-def simulate_video_generation(topic: str, context: str, max_scenes: int, task_id: str):
-    """Enhanced simulation for API demo."""
+async def simulate_video_generation(topic: str, context: str, max_scenes: int, task_id: str):
+    """Enhanced simulation for API demo.
+    
+    Stages are paced with asyncio.sleep so the event loop keeps serving other
+    requests while a demo task is running.
+    """
     stages = [
         ("🔍 Analyzing educational topic", 15),
         ("📚 Planning curriculum structure", 30),
@@ -186,13 +443,12 @@ def simulate_video_generation(topic: str, context: str, max_scenes: int, task_id
     ]
     
     results = []
-    for stage, progress in stages:
+    delays = _DELAY_RNG.uniform(0.5, 1.0, size=len(stages))  # Faster for API
+    for (stage, progress), delay in zip(stages, delays):
         # Update task status
-        if task_id in task_storage:
-            task_storage[task_id]["progress"] = progress
-            task_storage[task_id]["message"] = stage
+        task_store.update_fields(task_id, progress=progress, message=stage)
         
-        time.sleep(random.uniform(0.5, 1.0))  # Faster for API
+        await asyncio.sleep(float(delay))
         results.append(f"• {stage}")
     
     # Create demo information
@@ -216,28 +472,68 @@ def simulate_video_generation(topic: str, context: str, max_scenes: int, task_id
             "✅ RESTful API endpoints",
             "❌ Video rendering (requires local setup)"
         ],
-        "generated_at": datetime.now().isoformat()
+        "generated_at": _now_iso()
     }
     
     # Update final task status
-    if task_id in task_storage:
-        task_storage[task_id]["status"] = "completed"
-        task_storage[task_id]["progress"] = 100
-        task_storage[task_id]["message"] = "Task completed successfully"
-        task_storage[task_id]["result"] = demo_content
+    task_store.update_fields(
+        task_id,
+        status="completed",
+        progress=100,
+        message="Task completed successfully",
+        result=demo_content,
+        finished_at=_now_iso()
+    )
     
     return demo_content
 
+def dispatch_render_workflow(github_repo: str, github_token: str, video_id: str) -> int:
+    """Send a repository_dispatch event asking GitHub Actions to render a video.
+    
+    Returns the HTTP status code (204 on success).
+    """
+    import requests  # only needed on the real (non-demo) path
+    
+    url = f"https://api.github.com/repos/{github_repo}/dispatches"
+    headers = {
+        "Authorization": f"Bearer {github_token}",
+        "Accept": "application/vnd.github.v3+json",
+        "Content-Type": "application/json"
+    }
+    data = {
+        "event_type": "render_video",
+        "client_payload": {
+            "video_id": video_id
+        }
+    }
+    
+    response = requests.post(url, headers=headers, json=data, timeout=30)
+    return response.status_code
+
+def request_fingerprint(topic: str, context: str, max_scenes: int) -> str:
+    """Key identifying generation requests that would produce the same output."""
+    return hashlib.blake2b(f"{topic}|{context}|{max_scenes}".encode(), digest_size=16).hexdigest()
+
+async def run_generation_task(fingerprint: str, topic: str, context: str, max_scenes: int, task_id: str):
+    """Run a generation task and release its in-flight slot when it ends."""
+    try:
+        await generate_video_async(topic, context, max_scenes, task_id)
+    finally:
+        if in_flight_tasks.get(fingerprint) == task_id:
+            del in_flight_tasks[fingerprint]
+
 async def generate_video_async(topic: str, context: str, max_scenes: int, task_id: str):
     """Generate video asynchronously - delegates to GitHub Actions for rendering."""
     global video_generator
     
     try:
         # Update task status
-        if task_id in task_storage:
-            task_storage[task_id]["status"] = "running"
-            task_storage[task_id]["progress"] = 5
-            task_storage[task_id]["message"] = "Starting video generation..."
+        task_store.update_fields(
+            task_id,
+            status="running",
+            progress=5,
+            message="Starting video generation..."
+        )
         
         if not topic.strip():
             raise ValueError("Please provide an educational topic")
@@ -245,7 +541,7 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
         # Use demo mode if dependencies not available
         if DEMO_MODE or not CAN_IMPORT_DEPENDENCIES:
             logger.info(f"Running demo generation for topic: {topic}")
-            return simulate_video_generation(topic, context, max_scenes, task_id)
+            return await simulate_video_generation(topic, context, max_scenes, task_id)
 
         # Initialize Appwrite manager if not available
         if not video_generator or not hasattr(video_generator, 'appwrite_manager') or not video_generator.appwrite_manager:
@@ -253,7 +549,7 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
             appwrite_manager = AppwriteVideoManager()
             if not appwrite_manager.enabled:
                 logger.warning("Appwrite not available - falling back to demo mode")
-                return simulate_video_generation(topic, context, max_scenes, task_id)
+                return await simulate_video_generation(topic, context, max_scenes, task_id)
         else:
             appwrite_manager = video_generator.appwrite_manager
 
@@ -270,10 +566,12 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
                 raise Exception("Failed to create video record in Appwrite")
             
             # Update task storage with video ID for frontend tracking
-            if task_id in task_storage:
-                task_storage[task_id]["video_id"] = video_id
-                task_storage[task_id]["progress"] = 20
-                task_storage[task_id]["message"] = "Created video record - queuing for GitHub Actions..."
+            task_store.update_fields(
+                task_id,
+                video_id=video_id,
+                progress=20,
+                message="Created video record - queuing for GitHub Actions..."
+            )
             
             logger.info(f"✅ Created Appwrite video record: {video_id}")
             
@@ -286,36 +584,27 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
             
             if github_token and github_repo:
                 try:
-                    import requests
-                    
-                    url = f"https://api.github.com/repos/{github_repo}/dispatches"
-                    headers = {
-                        "Authorization": f"Bearer {github_token}",
-                        "Accept": "application/vnd.github.v3+json",
-                        "Content-Type": "application/json"
-                    }
-                    data = {
-                        "event_type": "render_video",
-                        "client_payload": {
-                            "video_id": video_id
-                        }
-                    }
+                    # Blocking HTTP call - run it off the event loop
+                    status_code = await asyncio.to_thread(
+                        dispatch_render_workflow, github_repo, github_token, video_id
+                    )
                     
-                    response = requests.post(url, headers=headers, json=data, timeout=30)
-                    
-                    if response.status_code == 204:
+                    if status_code == 204:
                         await appwrite_manager.update_video_status(video_id, "queued_for_render")
                         logger.info(f"✅ Triggered GitHub Actions workflow for video {video_id}")
                         
-                        if task_id in task_storage:
-                            task_storage[task_id]["progress"] = 100
-                            task_storage[task_id]["status"] = "completed"
-                            task_storage[task_id]["message"] = "✅ Video queued for GitHub Actions rendering!"
-                            task_storage[task_id]["result"] = {
+                        task_store.update_fields(
+                            task_id,
+                            progress=100,
+                            status="completed",
+                            message="✅ Video queued for GitHub Actions rendering!",
+                            result={
                                 "video_id": video_id,
                                 "status": "queued_for_render",
                                 "message": "Video processing delegated to GitHub Actions"
-                            }
+                            },
+                            finished_at=_now_iso()
+                        )
                         
                         return {
                             "success": True,
@@ -324,7 +613,7 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
                             "message": "Video queued for GitHub Actions rendering"
                         }
                     else:
-                        logger.warning(f"Failed to trigger GitHub workflow: {response.status_code}")
+                        logger.warning(f"Failed to trigger GitHub workflow: {status_code}")
                         
                 except Exception as e:
                     logger.warning(f"Failed to trigger GitHub workflow: {e}")
@@ -332,15 +621,18 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
             # Fallback - video will be picked up by scheduled GitHub Actions workflow
             await appwrite_manager.update_video_status(video_id, "queued_for_render")
             
-            if task_id in task_storage:
-                task_storage[task_id]["progress"] = 100
-                task_storage[task_id]["status"] = "completed"
-                task_storage[task_id]["message"] = "✅ Video queued for scheduled GitHub Actions processing!"
-                task_storage[task_id]["result"] = {
+            task_store.update_fields(
+                task_id,
+                progress=100,
+                status="completed",
+                message="✅ Video queued for scheduled GitHub Actions processing!",
+                result={
                     "video_id": video_id,
                     "status": "queued_for_render",
                     "message": "Video will be processed by GitHub Actions within 5 minutes"
-                }
+                },
+                finished_at=_now_iso()
+            )
             
             return {
                 "success": True,
@@ -355,10 +647,13 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, task_i
         
     except Exception as e:
         logger.error(f"Error in video generation: {e}")
-        if task_id in task_storage:
-            task_storage[task_id]["status"] = "failed"
-            task_storage[task_id]["error"] = str(e)
-            task_storage[task_id]["message"] = f"Error: {str(e)}"
+        task_store.update_fields(
+            task_id,
+            status="failed",
+            error=str(e),
+            message=f"Error: {str(e)}",
+            finished_at=_now_iso()
+        )
         raise e
 
 # Create FastAPI app
@@ -367,7 +662,8 @@ app = FastAPI(
     description="REST API for generating educational videos with AI",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -386,26 +682,65 @@ async def startup_event():
     setup_environment()
     init_status = initialize_video_generator()
     logger.info(f"Initialization status: {init_status}")
+    # Keep a reference: the event loop only holds tasks weakly
+    global _sweeper_task
+    _sweeper_task = asyncio.create_task(sweep_expired_tasks())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background work started at startup."""
+    if _sweeper_task is not None:
+        _sweeper_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _sweeper_task
+
+async def sweep_expired_tasks():
+    """Periodically drop expired tasks so memory is reclaimed without waiting for reads."""
+    while True:
+        await asyncio.sleep(TASK_SWEEP_INTERVAL)
+        evicted = task_store.evict_expired()
+        if evicted:
+            logger.info(f"Evicted {evicted} expired task(s)")
+
+# Static payloads are encoded once at import rather than on every request
+ROOT_INFO_JSON = orjson.dumps({
+    "message": "manimAnimationAgent API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/api/health"
+})
 
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "manimAnimationAgent API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/api/health"
-    }
+    return Response(content=ROOT_INFO_JSON, media_type="application/json")
 
 @app.post("/api/generate", response_model=VideoGenerationResponse)
 async def generate_video_api(request: VideoGenerationRequest, background_tasks: BackgroundTasks):
     """Generate educational video via API"""
-    task_id = str(uuid.uuid4())
+    # Coalesce retries/duplicates onto the generation already running. The
+    # lookup and the insert below run without awaiting, so they are atomic
+    # with respect to other requests on the event loop.
+    fingerprint = request_fingerprint(request.topic, request.context, request.max_scenes)
+    existing_id = in_flight_tasks.get(fingerprint)
+    existing = task_store.get(existing_id) if existing_id else None
+    if existing is not None:
+        logger.info(f"Reusing in-flight task {existing_id} for duplicate request: {request.topic}")
+        return VideoGenerationResponse(
+            success=True,
+            message="Identical video generation task already in progress",
+            task_id=existing_id,
+            status=existing["status"],
+            progress=existing["progress"]
+        )
+    
+    task_id = _new_task_id()
+    in_flight_tasks[fingerprint] = task_id
     
     logger.info(f"New video generation request: {request.topic} (Task ID: {task_id})")
     
     # Initialize task
-    task_storage[task_id] = {
+    task_store.set(task_id, {
         "task_id": task_id,
         "status": "queued",
         "progress": 0,
@@ -413,13 +748,15 @@ async def generate_video_api(request: VideoGenerationRequest, background_tasks:
         "result": None,
         "error": None,
         "video_id": None,  # Will be set when Appwrite record is created
-        "created_at": datetime.now().isoformat(),
+        "created_at": _now_iso(),
+        "finished_at": None,
         "request": request.dict()
-    }
+    })
     
     # Add background task
     background_tasks.add_task(
-        generate_video_async,
+        run_generation_task,
+        fingerprint,
         request.topic,
         request.context,
         request.max_scenes,
@@ -433,50 +770,104 @@ async def generate_video_api(request: VideoGenerationRequest, background_tasks:
         status="queued"
     )
 
+TASK_STATUS_FIELDS = tuple(TaskStatus.model_fields)
+
+def progress_view(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a task onto the fields polled by clients."""
+    return {
+        "status": task["status"],
+        "progress": task["progress"],
+        "message": task["message"],
+        "video_id": task.get("video_id"),
+        "finished_at": task.get("finished_at")
+    }
+
 @app.get("/api/status/{task_id}", response_model=TaskStatus)
-async def get_task_status(task_id: str):
-    """Get status of a video generation task"""
-    if task_id not in task_storage:
+async def get_task_status(task_id: str, include_result: bool = False):
+    """Get status of a video generation task
+    
+    The result payload is only included when include_result=true, so
+    polling clients don't pay for it on every request.
+    """
+    task = task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = task_storage[task_id]
-    return TaskStatus(**task)
+    # Tasks are built by this module, so skip re-validating them through TaskStatus
+    status = {field: task.get(field) for field in TASK_STATUS_FIELDS}
+    if not include_result:
+        status["result"] = None
+    return ORJSONResponse(status)
 
-@app.get("/api/tasks")
-async def list_tasks(limit: int = 10, status: Optional[str] = None):
-    """List tasks with optional filtering"""
-    tasks = list(task_storage.values())
+@app.get("/api/status/{task_id}/light", response_model=TaskProgress)
+async def get_task_progress(task_id: str):
+    """Get only the progress fields of a task, for frequent polling"""
+    task = task_store.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
     
-    # Filter by status if provided
-    if status:
-        tasks = [task for task in tasks if task["status"] == status]
+    return TaskProgress(**progress_view(task))
+
+@app.get("/api/status/{task_id}/stream")
+async def stream_task_status(task_id: str):
+    """Stream task progress as Server-Sent Events until the task finishes"""
+    if task_store.get(task_id) is None:
+        raise HTTPException(status_code=404, detail="Task not found")
     
-    # Sort by creation time (newest first)
-    tasks.sort(key=lambda x: x["created_at"], reverse=True)
+    async def event_stream():
+        event = task_store.subscribe(task_id)
+        last_sent = None
+        try:
+            while True:
+                event.clear()
+                task = task_store.get(task_id)
+                if task is None:
+                    break
+                
+                view = progress_view(task)
+                if view != last_sent:
+                    yield f"data: {json.dumps(view)}\n\n"
+                    last_sent = view
+                if task["status"] in TERMINAL_STATUSES:
+                    break
+                
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=SSE_KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            task_store.unsubscribe(task_id, event)
     
-    # Limit results
-    tasks = tasks[:limit]
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@app.get("/api/tasks")
+async def list_tasks(limit: int = 10, status: Optional[str] = None):
+    """List tasks with optional filtering (newest first)"""
+    total = len(task_store)
+    task_ids = task_store.recent_ids(min(limit, MAX_LIST_LIMIT), status=status)
     
-    return {
-        "tasks": tasks,
-        "total": len(task_storage),
-        "filtered": len(tasks)
-    }
+    # Splice the cached per-task JSON instead of re-encoding every task
+    blobs = [task_store.get_encoded(task_id) for task_id in task_ids]
+    blobs = [blob for blob in blobs if blob is not None]
+    body = b'{"tasks":[%s],"total":%d,"filtered":%d}' % (b",".join(blobs), total, len(blobs))
+    return Response(content=body, media_type="application/json")
 
 @app.delete("/api/tasks/{task_id}")
 async def delete_task(task_id: str):
     """Delete a specific task"""
-    if task_id not in task_storage:
+    if not task_store.delete(task_id):
         raise HTTPException(status_code=404, detail="Task not found")
     
-    del task_storage[task_id]
     return {"message": f"Task {task_id} deleted successfully"}
 
 @app.delete("/api/tasks")
 async def clear_all_tasks():
     """Clear all tasks"""
-    count = len(task_storage)
-    task_storage.clear()
+    count = task_store.clear()
     return {"message": f"Cleared {count} tasks"}
 
 @app.get("/api/health", response_model=HealthResponse)
@@ -486,19 +877,20 @@ async def health_check():
         status="healthy",
         demo_mode=DEMO_MODE,
         dependencies_available=CAN_IMPORT_DEPENDENCIES,
-        timestamp=datetime.now().isoformat()
+        timestamp=_now_iso()
     )
 
 @app.get("/api/stats")
 async def get_stats():
     """Get API statistics"""
+    tasks = task_store.snapshot()
     status_counts = {}
-    for task in task_storage.values():
+    for task in tasks:
         status = task["status"]
         status_counts[status] = status_counts.get(status, 0) + 1
     
     return {
-        "total_tasks": len(task_storage),
+        "total_tasks": len(tasks),
         "status_breakdown": status_counts,
         "demo_mode": DEMO_MODE,
         "dependencies_available": CAN_IMPORT_DEPENDENCIES,
@@ -506,40 +898,55 @@ async def get_stats():
     }
 
 # Example usage endpoint
+EXAMPLE_USAGE_JSON = orjson.dumps({
+    "example_request": {
+        "method": "POST",
+        "url": "/api/generate",
+        "body": {
+            "topic": "Pythagorean Theorem",
+            "context": "High school mathematics level",
+            "max_scenes": 3
+        }
+    },
+    "example_response": {
+        "success": True,
+        "message": "Video generation task queued successfully",
+        "task_id": "example-task-id",
+        "status": "queued"
+    },
+    "status_check": {
+        "method": "GET",
+        "url": "/api/status/example-task-id/light"
+    },
+    "result_fetch": {
+        "method": "GET",
+        "url": "/api/status/example-task-id?include_result=true"
+    }
+})
+
 @app.get("/api/example")
 async def get_example_usage():
     """Get example API usage"""
-    return {
-        "example_request": {
-            "method": "POST",
-            "url": "/api/generate",
-            "body": {
-                "topic": "Pythagorean Theorem",
-                "context": "High school mathematics level",
-                "max_scenes": 3
-            }
-        },
-        "example_response": {
-            "success": True,
-            "message": "Video generation task queued successfully",
-            "task_id": "example-task-id",
-            "status": "queued"
-        },
-        "status_check": {
-            "method": "GET",
-            "url": "/api/status/example-task-id"
-        }
-    }
+    return Response(content=EXAMPLE_USAGE_JSON, media_type="application/json")
 
 if __name__ == "__main__":
+    # uvicorn is only needed when serving directly; ASGI hosts import `app`
+    import uvicorn
+    
     # Setup environment
     setup_environment()
     
-    # Run the API server
+    # Run the API server. Task state lives in each worker's TaskStore, so
+    # API_WORKERS > 1 is only safe behind a sticky-session load balancer.
+    workers = int(os.getenv("API_WORKERS", 1))
+    reload = os.getenv("API_RELOAD", "false").lower() == "true" and workers == 1
     uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", 8000)),
-        reload=True,
+        workers=workers,
+        reload=reload,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
         log_level="info"
-    ) 
\ No newline at end of file
+    )
@@ -6,11 +6,14 @@ Generates educational videos using Gemini 2.0 Flash and Manim
 
 import os
 import sys
+import atexit
 import asyncio
-import time
-import random
+import functools
+import threading
+import importlib.util
 from typing import Dict, Any, Tuple, Optional
 from pathlib import Path
+import numpy as np
 import gradio as gr
 
 # Add src to path for imports
@@ -24,16 +27,38 @@ video_generator = None
 CAN_IMPORT_DEPENDENCIES = False
 GRADIO_OUTPUT_DIR = "gradio_outputs"
 DEPENDENCY_ERROR = None
+_DELAY_RNG = np.random.default_rng()
 
+# Gradio runs handlers on a pool of worker threads; each keeps one event loop
+# for its lifetime instead of building and tearing one down per generation
+_thread_loops = threading.local()
+_all_loops = []
+
+def _get_thread_loop():
+    """Return this thread's reusable event loop, creating it on first use."""
+    loop = getattr(_thread_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _thread_loops.loop = loop
+        _all_loops.append(loop)
+    return loop
+
+@atexit.register
+def _close_thread_loops():
+    for loop in _all_loops:
+        if not loop.is_running() and not loop.is_closed():
+            loop.close()
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
-    """Check if required dependencies are available."""
+    """Check if required dependencies are available (probed once per process)."""
     global CAN_IMPORT_DEPENDENCIES, DEPENDENCY_ERROR
     
     missing_deps = []
     
-    try:
-        import manim
-    except ImportError:
+    # Presence check only - no need to execute manim's package init here
+    if importlib.util.find_spec("manim") is None:
         missing_deps.append("manim")
     
     try:
@@ -78,6 +103,10 @@ def initialize_video_generator():
     """Initialize video generator with proper dependencies."""
     global video_generator, CAN_IMPORT_DEPENDENCIES, DEPENDENCY_ERROR
     
+    # Reuse the existing generator (and its model clients) on repeat calls
+    if video_generator is not None:
+        return "✅ Video generator already initialized"
+    
     try:
         if DEMO_MODE:
             return "⚠️ Demo mode enabled - No video generation"
@@ -122,7 +151,7 @@ def initialize_video_generator():
         print(f"❌ Error initializing video generator: {e}")
         return f"❌ Initialization failed: {str(e)}"
 
-def simulate_video_generation(topic: str, context: str, max_scenes: int, progress_callback=None):
+async def simulate_video_generation(topic: str, context: str, max_scenes: int, progress_callback=None):
     """Enhanced simulation for HF Spaces demo."""
     stages = [
         ("🔍 Analyzing educational topic", 15),
@@ -135,10 +164,11 @@ def simulate_video_generation(topic: str, context: str, max_scenes: int, progres
     ]
     
     results = []
-    for stage, progress in stages:
+    delays = _DELAY_RNG.uniform(0.8, 1.5, size=len(stages))
+    for (stage, progress), delay in zip(stages, delays):
         if progress_callback:
             progress_callback(progress, stage)
-        time.sleep(random.uniform(0.8, 1.5))
+        await asyncio.sleep(float(delay))
         results.append(f"• {stage}")
     
     # Create demo information
@@ -173,7 +203,7 @@ async def generate_video_async(topic: str, context: str, max_scenes: int, progre
     try:
         # Always use demo mode on HF Spaces due to dependency limitations
         if DEMO_MODE or not CAN_IMPORT_DEPENDENCIES or video_generator is None:
-            return simulate_video_generation(topic, context, max_scenes, progress_callback)
+            return await simulate_video_generation(topic, context, max_scenes, progress_callback)
         
         # This code would run with full dependencies (local setup)
         if progress_callback:
@@ -224,16 +254,10 @@ def generate_video_gradio(topic: str, context: str, max_scenes: int, progress=gr
     def progress_callback(percent, message):
         progress(percent / 100, desc=message)
     
-    # Create new event loop for this generation
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    try:
-        result = loop.run_until_complete(
-            generate_video_async(topic, context, max_scenes, progress_callback)
-        )
-    finally:
-        loop.close()
+    # Reuse this worker thread's event loop across generations
+    result = _get_thread_loop().run_until_complete(
+        generate_video_async(topic, context, max_scenes, progress_callback)
+    )
     
     if result["success"]:
         output = f"""# 🎓 Educational Content Generation
@@ -4,8 +4,6 @@ Minimal manimAnimationAgent for HF Spaces Zero GPU
 """
 
 import os
-import time
-import random
 import gradio as gr
 
 # Simple demo function
@@ -14,9 +12,6 @@ def generate_educational_content(topic, context, sections):
     if not topic.strip():
         return "❌ Please enter an educational topic", "❌ Failed"
     
-    # Simulate processing
-    time.sleep(random.uniform(1, 2))
-    
     output = f"""# 🎓 Educational Content Plan
 
 **Topic:** {topic}
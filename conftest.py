@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures for the root-level test scripts.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(scope="session")
+def memvid_rag():
+    """Memvid integration built once per test session (once per xdist worker)."""
+    from src.rag.memvid_integration import get_memvid_integration
+    
+    return get_memvid_integration(
+        video_file="manim_memory.mp4",
+        index_file="manim_memory_index.json"
+    )
@@ -10,6 +10,7 @@ This script demonstrates the enhanced error resolution system that uses:
 
 import os
 import sys
+import logging
 from src.utils.tavily_search import TavilyErrorSearchEngine
 
 def demo_fallback_system():
@@ -40,7 +41,7 @@ c = triangle.get_side_length(2)
     print()
     
     # Initialize Tavily engine
-    engine = TavilyErrorSearchEngine(verbose=True)
+    engine = TavilyErrorSearchEngine()
     
     print("🧪 **Testing Query Generation:**")
     analysis = engine.analyze_error_for_search(manim_error, code_context)
@@ -172,4 +173,5 @@ def main():
     print("It provides intelligent error resolution that adapts to any Manim error pattern!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     main() 
\ No newline at end of file
@@ -92,6 +92,32 @@ class AppwriteAgentMemory:
             print(f"Failed to store error-fix pattern: {e}")
             return False
 
+    async def store_error_fixes(self, fixes: List[Dict]) -> List[bool]:
+        """
+        Store several error-fix pairs in agent memory at once.
+        
+        Args:
+            fixes: Keyword arguments for store_error_fix, one dict per fix
+            
+        Returns:
+            List[bool]: Success flag for each fix, in input order
+        """
+        if not self.enabled:
+            return [False] * len(fixes)
+            
+        try:
+            results = await self.appwrite_manager.bulk_store_error_fixes(fixes)
+            
+            stored = sum(results)
+            if stored:
+                print(f"Stored {stored}/{len(fixes)} error-fix patterns")
+            
+            return results
+            
+        except Exception as e:
+            print(f"Failed to store error-fix patterns: {e}")
+            return [False] * len(fixes)
+
     async def search_similar_fixes(self, 
                            error_message: str, 
                            code_context: str, 
@@ -12,7 +12,9 @@ import hashlib
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
 
 try:
     from appwrite.client import Client
@@ -44,7 +46,8 @@ class AppwriteVideoManager:
     def __init__(self, 
                  api_key: Optional[str] = None,
                  project_id: Optional[str] = None,
-                 endpoint: Optional[str] = None):
+                 endpoint: Optional[str] = None,
+                 pool_size: int = 20):
         """
         Initialize Appwrite client and services.
         
@@ -52,6 +55,7 @@ class AppwriteVideoManager:
             api_key: Appwrite API key
             project_id: Appwrite project ID
             endpoint: Appwrite endpoint URL
+            pool_size: Max concurrent Appwrite SDK calls (worker threads)
         """
         self.enabled = HAS_APPWRITE
         
@@ -81,6 +85,10 @@ class AppwriteVideoManager:
             self.storage = Storage(self.client)
             self.users = Users(self.client)
             
+            # The SDK is synchronous; its calls run on a dedicated pool so
+            # bursts of Appwrite traffic don't starve the default executor
+            self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="appwrite")
+            
             # Database and collection IDs
             self.database_id = "video_metadata"
             self.videos_collection_id = "videos"
@@ -99,6 +107,11 @@ class AppwriteVideoManager:
             print(f"Failed to initialize Appwrite client: {e}")
             self.enabled = False
 
+    async def _sdk_call(self, method, **kwargs):
+        """Run a blocking Appwrite SDK call on the manager's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, **kwargs))
+
     async def setup_database_structure(self) -> bool:
         """
         Setup database collections and storage buckets.
@@ -533,7 +546,8 @@ class AppwriteVideoManager:
             video_id = ID.unique()
             current_time = datetime.now(timezone.utc).isoformat()
             
-            result = self.databases.create_document(
+            result = await self._sdk_call(
+                self.databases.create_document,
                 database_id=self.database_id,
                 collection_id=self.videos_collection_id,
                 document_id=video_id,
@@ -595,7 +609,8 @@ class AppwriteVideoManager:
             if total_duration:
                 update_data["total_duration"] = total_duration
             
-            self.databases.update_document(
+            await self._sdk_call(
+                self.databases.update_document,
                 database_id=self.database_id,
                 collection_id=self.videos_collection_id,
                 document_id=video_id,
@@ -623,7 +638,8 @@ class AppwriteVideoManager:
             return None
             
         try:
-            result = self.databases.get_document(
+            result = await self._sdk_call(
+                self.databases.get_document,
                 database_id=self.database_id,
                 collection_id=self.videos_collection_id,
                 document_id=video_id
@@ -663,7 +679,8 @@ class AppwriteVideoManager:
             if status:
                 queries.append(Query.equal("status", status))
             
-            result = self.databases.list_documents(
+            result = await self._sdk_call(
+                self.databases.list_documents,
                 database_id=self.database_id,
                 collection_id=self.videos_collection_id,
                 queries=queries
@@ -703,7 +720,8 @@ class AppwriteVideoManager:
             scene_id = ID.unique()
             current_time = datetime.now(timezone.utc).isoformat()
             
-            result = self.databases.create_document(
+            result = await self._sdk_call(
+                self.databases.create_document,
                 database_id=self.database_id,
                 collection_id=self.scenes_collection_id,
                 document_id=scene_id,
@@ -775,7 +793,8 @@ class AppwriteVideoManager:
             if error_message:
                 update_data["error_message"] = error_message
             
-            self.databases.update_document(
+            await self._sdk_call(
+                self.databases.update_document,
                 database_id=self.database_id,
                 collection_id=self.scenes_collection_id,
                 document_id=scene_id,
@@ -803,7 +822,8 @@ class AppwriteVideoManager:
             return []
             
         try:
-            result = self.databases.list_documents(
+            result = await self._sdk_call(
+                self.databases.list_documents,
                 database_id=self.database_id,
                 collection_id=self.scenes_collection_id,
                 queries=[
@@ -869,7 +889,8 @@ class AppwriteVideoManager:
                 memory_id = existing[0]["$id"]
                 success_count = existing[0].get("success_count", 0) + 1
                 
-                self.databases.update_document(
+                await self._sdk_call(
+                    self.databases.update_document,
                     database_id=self.database_id,
                     collection_id=self.agent_memory_collection_id,
                     document_id=memory_id,
@@ -883,7 +904,8 @@ class AppwriteVideoManager:
             else:
                 # Create new pattern
                 memory_id = ID.unique()
-                self.databases.create_document(
+                await self._sdk_call(
+                    self.databases.create_document,
                     database_id=self.database_id,
                     collection_id=self.agent_memory_collection_id,
                     document_id=memory_id,
@@ -909,6 +931,36 @@ class AppwriteVideoManager:
             print(f"Failed to store agent memory: {e}")
             return False
 
+    async def bulk_store_error_fixes(self, fixes: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Store several agent memory patterns in one call.
+        
+        Appwrite has no bulk document API, so distinct patterns are written
+        concurrently. Fixes that share an error hash are written in order, so
+        repeats update one pattern instead of racing to create duplicates.
+        
+        Args:
+            fixes: Keyword arguments for store_agent_memory, one dict per fix
+            
+        Returns:
+            List[bool]: Success flag for each fix, in input order
+        """
+        results = [False] * len(fixes)
+        if not self.enabled or not fixes:
+            return results
+        
+        groups: Dict[str, List[int]] = {}
+        for i, fix in enumerate(fixes):
+            error_hash = self._create_error_hash(fix["error_message"], fix["original_code"])
+            groups.setdefault(error_hash, []).append(i)
+        
+        async def store_group(indices: List[int]):
+            for i in indices:
+                results[i] = await self.store_agent_memory(**fixes[i])
+        
+        await asyncio.gather(*(store_group(indices) for indices in groups.values()))
+        return results
+
     async def search_agent_memory(self,
                                 error_hash: str = None,
                                 topic: str = None,
@@ -943,7 +995,8 @@ class AppwriteVideoManager:
             if fix_method:
                 queries.append(Query.equal("fix_method", fix_method))
             
-            result = self.databases.list_documents(
+            result = await self._sdk_call(
+                self.databases.list_documents,
                 database_id=self.database_id,
                 collection_id=self.agent_memory_collection_id,
                 queries=queries
@@ -988,7 +1041,8 @@ class AppwriteVideoManager:
                 file_id = file_id or ID.unique()
                 permissions = permissions or ["read(\"any\")"]
 
-                result = self.storage.create_file(
+                result = await self._sdk_call(
+                    self.storage.create_file,
                     bucket_id=bucket_id,
                     file_id=file_id,
                     file=InputFile.from_path(file_path),
@@ -1064,7 +1118,8 @@ class AppwriteVideoManager:
             # Get video counts by status
             video_stats = {}
             for status in ["queued", "planning", "rendering", "completed", "failed"]:
-                result = self.databases.list_documents(
+                result = await self._sdk_call(
+                    self.databases.list_documents,
                     database_id=self.database_id,
                     collection_id=self.videos_collection_id,
                     queries=[Query.equal("status", status), Query.limit(1)]
@@ -1072,7 +1127,8 @@ class AppwriteVideoManager:
                 video_stats[f"{status}_videos"] = result.get("total", 0)
             
             # Get scene stats
-            scene_result = self.databases.list_documents(
+            scene_result = await self._sdk_call(
+                self.databases.list_documents,
                 database_id=self.database_id,
                 collection_id=self.scenes_collection_id,
                 queries=[Query.limit(1)]
@@ -1080,7 +1136,8 @@ class AppwriteVideoManager:
             total_scenes = scene_result.get("total", 0)
             
             # Get memory stats
-            memory_result = self.databases.list_documents(
+            memory_result = await self._sdk_call(
+                self.databases.list_documents,
                 database_id=self.database_id,
                 collection_id=self.agent_memory_collection_id,
                 queries=[Query.limit(1)]
@@ -742,7 +742,7 @@ class CodeGenerator:
             
             # Step 2: Use Tavily to search for solutions
             print("🌐 Step 2: Searching for solutions with Tavily...")
-            tavily_engine = TavilyErrorSearchEngine(verbose=True)
+            tavily_engine = TavilyErrorSearchEngine()
             
             if not tavily_engine.is_available():
                 print("⚠️ Tavily not available - skipping Tavily-enhanced fix")
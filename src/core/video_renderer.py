@@ -17,6 +17,30 @@ except ImportError:
     VertexAIWrapper = None
 from mllm_tools.gemini import GeminiWrapper
 
+def _iter_dirs(path):
+    """Recursively yield os.DirEntry objects for every directory under path.
+
+    Uses os.scandir directly so type checks come from the directory listing
+    (no per-entry stat) and nothing is collected into intermediate lists.
+    Like os.walk, symlinked directories are reported but not descended into,
+    and directories that can't be listed (unreadable, or removed mid-walk)
+    are skipped.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                yield entry
+                if not entry.is_symlink():
+                    yield from _iter_dirs(entry.path)
+
 class VideoRenderer:
     """Class for rendering and combining Manim animation videos."""
 
@@ -274,12 +298,11 @@ class VideoRenderer:
         print(f"🔍 DEBUG: Searching for scene folders in: {search_path}")
         
         if os.path.exists(search_path):
-            for root, dirs, files in os.walk(search_path):
-                print(f"🔍 DEBUG: Walking through: {root} with dirs: {dirs}")
-                for dir in dirs:
-                    if dir.startswith(file_prefix + "_scene"):
-                        scene_folders.append(os.path.join(root, dir))
-                        print(f"🔍 DEBUG: Found scene folder: {os.path.join(root, dir)}")
+            scene_dir_prefix = file_prefix + "_scene"
+            for entry in _iter_dirs(search_path):
+                if entry.name.startswith(scene_dir_prefix):
+                    scene_folders.append(entry.path)
+                    print(f"🔍 DEBUG: Found scene folder: {entry.path}")
         else:
             print(f"🔍 DEBUG: Search path does not exist: {search_path}")
 
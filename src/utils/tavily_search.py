@@ -10,8 +10,13 @@ Author: manimAnimationAgent
 
 import os
 import re
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 try:
     from tavily import TavilyClient
@@ -19,6 +24,76 @@ try:
 except ImportError:
     TAVILY_AVAILABLE = False
 
+try:
+    # tavily-python raises this on HTTP 429 without attaching the response
+    from tavily import UsageLimitExceededError
+except ImportError:
+    class UsageLimitExceededError(Exception):
+        """Stand-in so rate-limit handling works without tavily-python installed"""
+
+logger = logging.getLogger(__name__)
+
+# Whitespace normalization patterns for extracted page content
+_WS_NL_RE = re.compile(r'\n\s*\n\s*\n')
+_WS_SP_RE = re.compile(r'[ \t]+')
+
+# Traceback / code analysis patterns, compiled once at import
+_ERROR_TYPE_RES = tuple(re.compile(p) for p in (
+    r'(\w*Error): ',
+    r'(\w*Exception): ',
+    r'(\w*Warning): '
+))
+_MANIM_COMPONENT_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(manim\.\w+)',
+    r'(\w+\.animate\.\w+)',
+    r'(self\.play\([^)]+\))',
+    r'(\w+(?:Mobject|Animation|Scene)\w*)',
+    r'(Polygon|Triangle|Square|Circle|Rectangle)',  # Common shapes
+    r'(get_\w+)',  # Common getter methods
+    r'(Angle|Line|Arrow|Text|MathTex)',  # Common objects
+))
+_MISSING_ATTR_RE = re.compile(r'AttributeError.*\'(\w+)\' object has no attribute \'(\w+)\'')
+_TYPE_ERROR_CALL_RE = re.compile(r'TypeError: (\w+)\.(\w+)\(\) (.*)')
+_METHOD_CALL_RE = re.compile(r'(\w+)\.(\w+)\(')
+_FILE_LINE_RE = re.compile(r'File "([^"]+)", line (\d+)')
+_ERROR_MSG_RE = re.compile(r'(\w+(?:Error|Exception)): (.+)$', re.MULTILINE)
+_ERROR_PHRASE_RES = tuple(re.compile(p, re.MULTILINE | re.IGNORECASE) for p in (
+    r'ValueError: (.+?)(?:\n|$)',
+    r'TypeError: (.+?)(?:\n|$)',
+    r'AttributeError: (.+?)(?:\n|$)',
+    r'ImportError: (.+?)(?:\n|$)',
+    r'ModuleNotFoundError: (.+?)(?:\n|$)',
+    r'(\w+Error: .+?)(?:\n|$)',
+    r'(\w+Exception: .+?)(?:\n|$)'
+))
+_PY_PATH_LINE_RE = re.compile(r'/[\w/.-]+\.py:\d+')
+_FILE_REF_RE = re.compile(r'File "[^"]+", line \d+')
+_NO_ATTR_NAME_RE = re.compile(r"has no attribute '(\w+)'")
+
+# Manim objects in priority order (most specific first), with lowercase forms
+_MANIM_OBJECTS = tuple((obj, obj.lower()) for obj in (
+    # Geometry objects
+    'Polygon', 'Triangle', 'Square', 'Circle', 'Rectangle', 'RegularPolygon', 'Ellipse',
+    'Line', 'Arrow', 'Vector', 'Angle', 'Arc', 'Sector', 'Annulus',
+    
+    # Text and Math
+    'Text', 'MathTex', 'Tex', 'MarkupText', 'Code',
+    
+    # 3D objects
+    'Sphere', 'Cube', 'Cylinder', 'Cone', 'Torus', 'Surface', 'ParametricSurface',
+    
+    # Animations
+    'Transform', 'ReplacementTransform', 'TransformMatchingTex', 'FadeIn', 'FadeOut',
+    'Create', 'Write', 'DrawBorderThenFill', 'ShowCreation', 'GrowFromCenter',
+    'Indicate', 'Flash', 'Circumscribe', 'Wiggle', 'Rotate', 'Move', 'Shift',
+    
+    # Scene and groups
+    'Scene', 'VGroup', 'Group', 'VMobject', 'Mobject',
+    
+    # Number line and graphs
+    'NumberLine', 'Axes', 'Graph', 'BarChart', 'PieChart'
+))
+
 
 @dataclass
 class ErrorAnalysis:
@@ -29,6 +104,18 @@ class ErrorAnalysis:
     context_info: str
 
 
+# Analysis depends only on the (traceback, code_context) text, so results are
+# shared across engine instances, keyed on a hash of the stripped inputs
+_ANALYSIS_CACHE_SIZE = 256
+_analysis_cache: "OrderedDict[bytes, ErrorAnalysis]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_key(traceback: str, code_context: str) -> bytes:
+    """Digest identifying an analysis input"""
+    return hashlib.sha256(f"{traceback}\0{code_context}".encode("utf-8")).digest()
+
+
 class TavilyErrorSearchEngine:
     """
     Advanced error-driven development engine using Tavily for intelligent error resolution.
@@ -38,37 +125,39 @@ class TavilyErrorSearchEngine:
     2. Search for solutions using Tavily and provide structured results
     """
     
-    def __init__(self, api_key: Optional[str] = None, verbose: bool = False):
+    def __init__(self, api_key: Optional[str] = None, rate_per_min: float = 60.0,
+                 max_retries: int = 3):
         """
         Initialize the Tavily Error Search Engine.
         
         Args:
             api_key: Tavily API key. If None, will try to get from TAVILY_API_KEY env var
-            verbose: Whether to print detailed logs
+            rate_per_min: Maximum Tavily requests per minute issued by this instance
+            max_retries: How many times to retry a call rejected with HTTP 429
         """
-        self.verbose = verbose
         self.client = None
+        self.rate_per_min = rate_per_min
+        self.max_retries = max_retries
+        # Earliest time (time.monotonic_ns) the next Tavily request may be sent
+        self._next_ok_ns = 0
+        self._rate_lock = threading.Lock()
         
         if not TAVILY_AVAILABLE:
-            if self.verbose:
-                print("⚠️ Tavily not available. Install with: pip install tavily-python")
+            logger.info("⚠️ Tavily not available. Install with: pip install tavily-python")
             return
             
         # Get API key from parameter or environment
         self.api_key = api_key or os.getenv('TAVILY_API_KEY')
         
         if not self.api_key:
-            if self.verbose:
-                print("⚠️ No Tavily API key found. Set TAVILY_API_KEY environment variable or pass api_key parameter")
+            logger.info("⚠️ No Tavily API key found. Set TAVILY_API_KEY environment variable or pass api_key parameter")
             return
             
         try:
             self.client = TavilyClient(api_key=self.api_key)
-            if self.verbose:
-                print("✅ Tavily client initialized successfully")
+            logger.debug("✅ Tavily client initialized successfully")
         except Exception as e:
-            if self.verbose:
-                print(f"⚠️ Failed to initialize Tavily client: {e}")
+            logger.warning("⚠️ Failed to initialize Tavily client: %s", e)
             self.client = None
 
     def is_available(self) -> bool:
@@ -89,10 +178,19 @@ class TavilyErrorSearchEngine:
         Returns:
             ErrorAnalysis object with structured error information
         """
-        if self.verbose:
-            # print("🔍 Analyzing error for search query generation using Gemini...")
-            pass  # Removed noisy Gemini analyzer log
-            
+        # Surrounding whitespace doesn't change the analysis; dropping it lets
+        # re-indented copies of the same traceback share a cache entry
+        traceback = traceback.strip()
+        code_context = code_context.strip()
+        key = _analysis_key(traceback, code_context)
+        with _analysis_cache_lock:
+            cached = _analysis_cache.get(key)
+            if cached is not None:
+                _analysis_cache.move_to_end(key)
+        if cached is not None:
+            # Copy so callers can't mutate the shared entry's component list
+            return replace(cached, key_components=list(cached.key_components))
+        
         # Extract key error components for Gemini analysis
         error_type = self._extract_error_type(traceback)
         key_components = self._extract_key_components(traceback, code_context)
@@ -108,13 +206,34 @@ class TavilyErrorSearchEngine:
             context_info=context_info
         )
         
-        if self.verbose:
-            print(f"📋 Error Analysis:")
-            print(f"   Type: {analysis.error_type}")
-            print(f"   Key Components: {analysis.key_components}")
-            print(f"   Search Query ({len(analysis.search_query)} chars): {analysis.search_query}")
+        logger.debug(
+            "📋 Error Analysis: type=%s, key components=%s, search query (%d chars): %s",
+            analysis.error_type, analysis.key_components,
+            len(analysis.search_query), analysis.search_query
+        )
+        
+        with _analysis_cache_lock:
+            _analysis_cache[key] = analysis
+            if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
             
-        return analysis
+        return replace(analysis, key_components=list(analysis.key_components))
+
+    def analyze_batch(self, traceback_code_pairs: List[Tuple[str, str]]) -> List[ErrorAnalysis]:
+        """
+        Analyze several (traceback, code_context) pairs in one call.
+        
+        All pattern tables are shared module-level state, so a batch costs
+        only the per-traceback matching work.
+        
+        Args:
+            traceback_code_pairs: (traceback, code_context) tuples to analyze
+            
+        Returns:
+            ErrorAnalysis objects in the same order as the input pairs
+        """
+        analyze = self.analyze_error_for_search
+        return [analyze(traceback, code_context) for traceback, code_context in traceback_code_pairs]
 
     def search_for_solution(self, error_analysis: ErrorAnalysis, max_results: int = 5, extract_content: bool = True) -> Dict:
         """
@@ -136,11 +255,11 @@ class TavilyErrorSearchEngine:
             }
             
         try:
-            if self.verbose:
-                print(f"🔍 Searching Tavily for: {error_analysis.search_query}")
+            logger.debug("🔍 Searching Tavily for: %s", error_analysis.search_query)
                 
             # Perform the search with documentation priority
-            response = self.client.search(
+            response = self._rate_limited_call(
+                self.client.search,
                 query=error_analysis.search_query,
                 search_depth="advanced",
                 max_results=max_results,
@@ -161,17 +280,15 @@ class TavilyErrorSearchEngine:
             if extract_content and processed_results.get("solutions"):
                 processed_results = self._extract_full_content(processed_results, max_extractions=3)
             
-            if self.verbose:
-                print(f"✅ Found {len(processed_results.get('solutions', []))} potential solutions")
-                if extract_content:
-                    extracted_count = sum(1 for sol in processed_results.get('solutions', []) if sol.get('extracted_content'))
-                    print(f"📄 Extracted full content from {extracted_count} URLs")
+            logger.debug("✅ Found %d potential solutions", len(processed_results.get('solutions', [])))
+            if extract_content and logger.isEnabledFor(logging.DEBUG):
+                extracted_count = sum(1 for sol in processed_results.get('solutions', []) if sol.get('extracted_content'))
+                logger.debug("📄 Extracted full content from %d URLs", extracted_count)
                 
             return processed_results
             
         except Exception as e:
-            if self.verbose:
-                print(f"⚠️ Tavily search failed: {e}")
+            logger.warning("⚠️ Tavily search failed: %s", e)
             return {
                 "available": True,
                 "error": str(e),
@@ -214,17 +331,57 @@ class TavilyErrorSearchEngine:
             "timestamp": self._get_timestamp()
         }
 
+    def _rate_limited_call(self, method, **kwargs):
+        """
+        Invoke a Tavily client method, pacing requests and retrying on rate limits.
+        
+        Waits until the per-instance rate limit allows another request, then calls
+        the method. Safe to call from several threads sharing one engine. If
+        Tavily answers with HTTP 429, the next request is scheduled after the
+        server's Retry-After delay (or an exponential backoff when the header
+        is absent) and the call is retried up to max_retries times.
+        """
+        for attempt in range(self.max_retries + 1):
+            # Reserve a send slot under the lock so threads sharing this engine
+            # are spaced out instead of all firing at once
+            with self._rate_lock:
+                now_ns = time.monotonic_ns()
+                send_ns = max(self._next_ok_ns, now_ns)
+                self._next_ok_ns = send_ns + int(60.0 / self.rate_per_min * 1e9)
+            if send_ns > now_ns:
+                time.sleep((send_ns - now_ns) / 1e9)
+            
+            try:
+                return method(**kwargs)
+            except Exception as e:
+                retry_after = self._get_retry_after(e, attempt)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+                logger.info("⏳ Tavily rate limit hit, retrying in %.1fs", retry_after)
+                with self._rate_lock:
+                    self._next_ok_ns = max(self._next_ok_ns, time.monotonic_ns() + int(retry_after * 1e9))
+
+    def _get_retry_after(self, error: Exception, attempt: int) -> Optional[float]:
+        """Return the delay in seconds before retrying, or None if the error is not a rate limit"""
+        if isinstance(error, UsageLimitExceededError):
+            # Only the client's keyless-limit subclass carries a server delay
+            retry_after = getattr(error, "retry_after_seconds", None)
+        else:
+            response = getattr(error, "response", None)
+            if response is None or getattr(response, "status_code", None) != 429:
+                return None
+            retry_after = response.headers.get("Retry-After")
+        
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            return float(2 ** attempt)
+
     def _extract_error_type(self, traceback: str) -> str:
         """Extract the type of error from traceback"""
         # Look for common Python exception types
-        error_patterns = [
-            r'(\w*Error): ',
-            r'(\w*Exception): ',
-            r'(\w*Warning): '
-        ]
-        
-        for pattern in error_patterns:
-            match = re.search(pattern, traceback)
+        for pattern in _ERROR_TYPE_RES:
+            match = pattern.search(traceback)
             if match:
                 return match.group(1)
                 
@@ -234,40 +391,26 @@ class TavilyErrorSearchEngine:
         """Extract key components that should be included in search"""
         components = []
         
-        # Extract Manim-specific components with better patterns
-        manim_patterns = [
-            r'(manim\.\w+)',
-            r'(\w+\.animate\.\w+)',
-            r'(self\.play\([^)]+\))',
-            r'(\w+(?:Mobject|Animation|Scene)\w*)',
-            r'(Polygon|Triangle|Square|Circle|Rectangle)', # Common shapes
-            r'(get_\w+)', # Common getter methods
-            r'(Angle|Line|Arrow|Text|MathTex)', # Common objects
-        ]
-        
+        # Extract Manim-specific components
         text_to_search = traceback + " " + code_context
         
-        for pattern in manim_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
-            components.extend(matches)
+        for pattern in _MANIM_COMPONENT_RES:
+            components.extend(pattern.findall(text_to_search))
         
         # Extract specific method names that failed
-        method_pattern = r'AttributeError.*\'(\w+)\' object has no attribute \'(\w+)\''
-        method_match = re.search(method_pattern, traceback)
+        method_match = _MISSING_ATTR_RE.search(traceback)
         if method_match:
             obj_type, method_name = method_match.groups()
             components.extend([obj_type, method_name])
             
         # Extract specific TypeError patterns
-        type_error_pattern = r'TypeError: (\w+)\.(\w+)\(\) (.*)'
-        type_match = re.search(type_error_pattern, traceback)
+        type_match = _TYPE_ERROR_CALL_RE.search(traceback)
         if type_match:
             class_name, method_name, error_detail = type_match.groups()
             components.extend([class_name, method_name])
             
         # Extract specific method calls from code context
-        method_call_pattern = r'(\w+)\.(\w+)\('
-        method_calls = re.findall(method_call_pattern, code_context)
+        method_calls = _METHOD_CALL_RE.findall(code_context)
         for obj_name, method_name in method_calls[-3:]:  # Last 3 method calls
             components.extend([obj_name, method_name])
         
@@ -280,15 +423,13 @@ class TavilyErrorSearchEngine:
         context_parts = []
         
         # Extract file and line number
-        file_pattern = r'File "([^"]+)", line (\d+)'
-        file_match = re.search(file_pattern, traceback)
+        file_match = _FILE_LINE_RE.search(traceback)
         if file_match:
             file_path, line_num = file_match.groups()
             context_parts.append(f"File: {os.path.basename(file_path)}:{line_num}")
         
         # Extract the actual error message
-        error_msg_pattern = r'(\w+(?:Error|Exception)): (.+)$'
-        error_match = re.search(error_msg_pattern, traceback, re.MULTILINE)
+        error_match = _ERROR_MSG_RE.search(traceback)
         if error_match:
             error_type, error_msg = error_match.groups()
             context_parts.append(f"Message: {error_msg.strip()}")
@@ -345,18 +486,15 @@ class TavilyErrorSearchEngine:
         urls_to_extract = [sol["url"] for sol in prioritized_solutions if sol["url"]]
         
         if not urls_to_extract:
-            if self.verbose:
-                print("⚠️ No valid URLs found for content extraction")
+            logger.debug("⚠️ No valid URLs found for content extraction")
             return search_results
         
         try:
-            if self.verbose:
-                print(f"📄 Extracting content from TOP {len(urls_to_extract)} URLs (max 3)...")
-                for i, url in enumerate(urls_to_extract, 1):
-                    print(f"   {i}. {url}")
+            logger.debug("📄 Extracting content from TOP %d URLs: %s", len(urls_to_extract), urls_to_extract)
                 
             # Use Tavily Extract API to get full page content
-            extract_response = self.client.extract(
+            extract_response = self._rate_limited_call(
+                self.client.extract,
                 urls=urls_to_extract,
                 include_images=False,  # Focus on text content for error resolution
                 extract_depth="basic",  # Basic extraction is sufficient for most cases
@@ -378,18 +516,18 @@ class TavilyErrorSearchEngine:
                 url = solution["url"]
                 if url in extraction_results:
                     solution["extracted_content"] = extraction_results[url]
-                    if self.verbose:
-                        content_length = len(extraction_results[url])
-                        print(f"✅ Extracted {content_length} characters from {solution['source_type']}: {solution['title'][:50]}...")
+                    logger.debug(
+                        "✅ Extracted %d characters from %s: %.50s...",
+                        len(extraction_results[url]), solution['source_type'], solution['title']
+                    )
             
             # Handle failed extractions
             failed_results = extract_response.get("failed_results", [])
-            if failed_results and self.verbose:
-                print(f"⚠️ Failed to extract content from {len(failed_results)} URLs")
+            if failed_results:
+                logger.debug("⚠️ Failed to extract content from %d URLs", len(failed_results))
                 
         except Exception as e:
-            if self.verbose:
-                print(f"⚠️ Content extraction failed: {e}")
+            logger.warning("⚠️ Content extraction failed: %s", e)
         
         return search_results
 
@@ -420,9 +558,14 @@ class TavilyErrorSearchEngine:
         if not raw_content:
             return ""
         
+        # Truncate before cleanup so the regex passes only scan what can be kept
+        # (2x margin leaves room for whitespace collapse)
+        if len(raw_content) > max_length * 2:
+            raw_content = raw_content[:max_length * 2]
+        
         # Remove excessive whitespace and clean up formatting
-        cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', raw_content)  # Reduce multiple newlines
-        cleaned = re.sub(r'[ \t]+', ' ', cleaned)  # Normalize spaces
+        cleaned = _WS_NL_RE.sub('\n\n', raw_content)  # Reduce multiple newlines
+        cleaned = _WS_SP_RE.sub(' ', cleaned)  # Normalize spaces
         cleaned = cleaned.strip()
         
         # Truncate if too long (keep within token limits)
@@ -571,35 +714,11 @@ class TavilyErrorSearchEngine:
 
     def _extract_main_manim_object(self, traceback: str, key_components: List[str]) -> str:
         """Extract the main Manim object/class that's causing the error"""
-        # Priority order for Manim objects (most specific first)
-        manim_objects = [
-            # Geometry objects
-            'Polygon', 'Triangle', 'Square', 'Circle', 'Rectangle', 'RegularPolygon', 'Ellipse',
-            'Line', 'Arrow', 'Vector', 'Angle', 'Arc', 'Sector', 'Annulus',
-            
-            # Text and Math
-            'Text', 'MathTex', 'Tex', 'MarkupText', 'Code',
-            
-            # 3D objects
-            'Sphere', 'Cube', 'Cylinder', 'Cone', 'Torus', 'Surface', 'ParametricSurface',
-            
-            # Animations
-            'Transform', 'ReplacementTransform', 'TransformMatchingTex', 'FadeIn', 'FadeOut',
-            'Create', 'Write', 'DrawBorderThenFill', 'ShowCreation', 'GrowFromCenter',
-            'Indicate', 'Flash', 'Circumscribe', 'Wiggle', 'Rotate', 'Move', 'Shift',
-            
-            # Scene and groups
-            'Scene', 'VGroup', 'Group', 'VMobject', 'Mobject',
-            
-            # Number line and graphs
-            'NumberLine', 'Axes', 'Graph', 'BarChart', 'PieChart'
-        ]
-        
         # Search in traceback and key components
         text_to_search = (traceback + " " + " ".join(key_components)).lower()
         
-        for obj in manim_objects:
-            if obj.lower() in text_to_search:
+        for obj, obj_lower in _MANIM_OBJECTS:
+            if obj_lower in text_to_search:
                 return obj
         
         # Fallback to first component that looks like a class (capitalized)
@@ -612,30 +731,15 @@ class TavilyErrorSearchEngine:
     def _extract_key_error_phrase(self, traceback: str) -> str:
         """Extract the most descriptive part of the error message"""
         # Look for the actual error message line
-        error_message_patterns = [
-            # ValueError patterns
-            r'ValueError: (.+?)(?:\n|$)',
-            # TypeError patterns  
-            r'TypeError: (.+?)(?:\n|$)',
-            # AttributeError patterns
-            r'AttributeError: (.+?)(?:\n|$)',
-            # ImportError patterns
-            r'ImportError: (.+?)(?:\n|$)',
-            r'ModuleNotFoundError: (.+?)(?:\n|$)',
-            # Generic error patterns
-            r'(\w+Error: .+?)(?:\n|$)',
-            r'(\w+Exception: .+?)(?:\n|$)'
-        ]
-        
-        for pattern in error_message_patterns:
-            match = re.search(pattern, traceback, re.MULTILINE | re.IGNORECASE)
+        for pattern in _ERROR_PHRASE_RES:
+            match = pattern.search(traceback)
             if match:
                 error_msg = match.group(1).strip()
                 
                 # Clean up and shorten the error message for search
                 # Remove file paths and line numbers
-                error_msg = re.sub(r'/[\w/.-]+\.py:\d+', '', error_msg)
-                error_msg = re.sub(r'File "[^"]+", line \d+', '', error_msg)
+                error_msg = _PY_PATH_LINE_RE.sub('', error_msg)
+                error_msg = _FILE_REF_RE.sub('', error_msg)
                 
                 # Remove excessive technical details but keep key phrases
                 if "same number of dimensions" in error_msg:
@@ -644,7 +748,7 @@ class TavilyErrorSearchEngine:
                     return "takes positional argument"
                 elif "has no attribute" in error_msg:
                     # Extract the attribute name
-                    attr_match = re.search(r"has no attribute '(\w+)'", error_msg)
+                    attr_match = _NO_ATTR_NAME_RE.search(error_msg)
                     if attr_match:
                         return f"has no attribute {attr_match.group(1)}"
                 elif "unexpected keyword argument" in error_msg:
@@ -672,5 +776,5 @@ def search_error_solution(traceback: str, code_context: str = "", api_key: Optio
     Returns:
         Dictionary with error analysis, solution suggestions, and extracted content
     """
-    engine = TavilyErrorSearchEngine(api_key=api_key, verbose=True)
+    engine = TavilyErrorSearchEngine(api_key=api_key)
     return engine.get_error_resolution_suggestions(traceback, code_context, extract_content=extract_content) 
\ No newline at end of file
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Test client for the manimAnimationAgent FastAPI server (api_server.py)
+Usage: python test_api.py [base_url]
+"""
+
+import os
+import sys
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8000")
+TERMINAL_STATUSES = ("completed", "failed")
+POLL_INITIAL_DELAY = 0.25  # seconds before the first re-poll
+POLL_BACKOFF = 1.7
+POLL_MAX_DELAY = 4.0
+SSE_READ_TIMEOUT = 30  # server sends a keep-alive comment every 15s
+
+class TheoremExplainClient:
+    """Small synchronous client for the video generation API."""
+
+    def __init__(self, base_url: str = API_BASE):
+        self.base_url = base_url.rstrip("/")
+
+        # Endpoint URLs built once; status polls only format the task id in
+        self._health_url = f"{self.base_url}/api/health"
+        self._stats_url = f"{self.base_url}/api/stats"
+        self._generate_url = f"{self.base_url}/api/generate"
+        self._status_fmt = f"{self.base_url}/api/status/{{}}".format
+        self._progress_fmt = f"{self.base_url}/api/status/{{}}/light".format
+        self._stream_fmt = f"{self.base_url}/api/status/{{}}/stream".format
+
+        # One keep-alive session for every call, so status polls reuse the
+        # same pooled connections instead of a new TCP/TLS handshake each
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip"})
+
+    def health_check(self) -> dict:
+        """Return the server health payload."""
+        response = self.session.get(self._health_url, timeout=10)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def get_stats(self) -> dict:
+        """Return task statistics from the server."""
+        response = self.session.get(self._stats_url, timeout=10)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def generate_video(self, topic: str, context: str = "", max_scenes: int = 3) -> dict:
+        """Queue a generation task and return the server's response."""
+        response = self.session.post(
+            self._generate_url,
+            json={"topic": topic, "context": context, "max_scenes": max_scenes},
+            timeout=30
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def check_status(self, task_id: str, include_result: bool = False) -> dict:
+        """Return the current status of a task.
+
+        The server leaves out the result payload unless include_result is set.
+        """
+        params = {"include_result": "true"} if include_result else None
+        response = self.session.get(self._status_fmt(task_id), params=params, timeout=10)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def check_progress(self, task_id: str) -> dict:
+        """Return only the progress fields of a task (cheap enough to poll)."""
+        response = self.session.get(self._progress_fmt(task_id), timeout=10)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def wait_for_completion(self, task_id: str, timeout: float = 120) -> dict:
+        """Poll a task until it completes or fails.
+
+        Polls start fast and back off exponentially up to POLL_MAX_DELAY, so
+        short tasks return quickly and long ones don't issue needless polls.
+        Polls hit the lightweight progress endpoint; the full record is
+        fetched once the task finishes.
+        """
+        deadline = time.monotonic() + timeout
+        delay = POLL_INITIAL_DELAY
+        while time.monotonic() < deadline:
+            progress = self.check_progress(task_id)
+            print(f"   [{task_id}] {progress['progress']}% - {progress['message']}")
+            if progress["status"] in TERMINAL_STATUSES:
+                return self.check_status(task_id, include_result=True)
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+        raise TimeoutError(f"Task {task_id} did not finish within {timeout}s")
+
+    def wait_for_completion_sse(self, task_id: str, timeout: float = 120) -> dict:
+        """Wait for a task by subscribing to its Server-Sent Events stream.
+
+        One long-lived request receives progress updates as they happen
+        instead of polling. Falls back to wait_for_completion if the server
+        has no stream endpoint or the stream ends early.
+        """
+        deadline = time.monotonic() + timeout
+        with self.session.get(self._stream_fmt(task_id), stream=True,
+                              timeout=(10, SSE_READ_TIMEOUT)) as response:
+            if response.status_code == 404:
+                return self.wait_for_completion(task_id, timeout)
+            response.raise_for_status()
+
+            for line in response.iter_lines():
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Task {task_id} did not finish within {timeout}s")
+                if not line.startswith(b"data: "):
+                    continue  # keep-alive comments and frame separators
+                view = json_loads(line[6:])
+                print(f"   [{task_id}] {view['progress']}% - {view['message']}")
+                if view["status"] in TERMINAL_STATUSES:
+                    # The stream carries the progress view; fetch the full record once
+                    return self.check_status(task_id, include_result=True)
+
+        return self.wait_for_completion(task_id, max(deadline - time.monotonic(), 0))
+
+def test_api(base_url: str = API_BASE) -> bool:
+    """Exercise the API end to end against a running server."""
+    print(f"🧪 Testing API at {base_url}")
+    client = TheoremExplainClient(base_url)
+
+    try:
+        health = client.health_check()
+    except requests.RequestException as e:
+        print(f"❌ Health check failed: {e}")
+        return False
+    print(f"✅ Server healthy (demo mode: {health['demo_mode']})")
+
+    test_cases = [
+        {"topic": "Pythagorean Theorem", "context": "Visual proof for high school students", "max_scenes": 2},
+        {"topic": "Newton's Second Law", "context": "F=ma with real-world examples", "max_scenes": 3},
+        {"topic": "Derivatives", "context": "Rate of change with graphs", "max_scenes": 2}
+    ]
+
+    # Queue every case up front, then wait on all of them concurrently so the
+    # run takes about as long as the slowest task rather than the sum
+    all_passed = True
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        futures = {}
+        for test_case in test_cases:
+            print(f"\n📋 Generating: {test_case['topic']}")
+            try:
+                result = client.generate_video(**test_case)
+            except requests.RequestException as e:
+                print(f"❌ {test_case['topic']} failed: {e}")
+                all_passed = False
+                continue
+            futures[executor.submit(client.wait_for_completion_sse, result["task_id"])] = test_case
+
+        for future in as_completed(futures):
+            test_case = futures[future]
+            try:
+                final = future.result()
+            except (requests.RequestException, TimeoutError) as e:
+                print(f"❌ {test_case['topic']} failed: {e}")
+                all_passed = False
+                continue
+
+            if final["status"] == "completed":
+                print(f"✅ {test_case['topic']} completed")
+            else:
+                print(f"❌ {test_case['topic']} failed: {final.get('error')}")
+                all_passed = False
+
+    print(f"\n📊 Stats: {client.get_stats()}")
+    return all_passed
+
+if __name__ == "__main__":
+    success = test_api(sys.argv[1] if len(sys.argv) > 1 else API_BASE)
+    sys.exit(0 if success else 1)
@@ -5,44 +5,58 @@ Usage: python test_api_keys.py
 """
 
 import os
-import sys
+import re
+import asyncio
+import itertools
+import aiohttp
 from dotenv import load_dotenv
 
-def test_gemini_api():
+from _fs_util import exists
+
+# Load the .env file once and resolve the keys the checks need
+load_dotenv()
+GEMINI_KEY = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+ELEVEN_KEY = os.getenv("ELEVENLABS_API_KEY")
+
+# Comma-separated Gemini keys are parsed once and handed out round-robin
+_KEYS = [key.strip() for key in (GEMINI_KEY or "").split(",") if key.strip()]
+_KEY_CYCLE = itertools.cycle(_KEYS) if _KEYS else None
+
+SEP50 = "=" * 50
+
+# Cheap local format checks so malformed keys fail before any network call.
+# ElevenLabs doesn't document its key format, so that pattern only warns
+_GEMINI_KEY_RE = re.compile(r"^AIza[0-9A-Za-z_-]{35}$")
+_ELEVEN_KEY_RE = re.compile(r"^(sk_)?[0-9a-fA-F]{32,64}$")
+
+async def check_gemini_api():
     """Test Gemini API key(s)"""
     print("Testing Gemini API...")
     
     try:
         import google.generativeai as genai
-        import random
-        
-        # Load environment variables
-        load_dotenv()
         
-        # Get API key with fallback support
-        gemini_key_env = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-        if not gemini_key_env:
+        if _KEY_CYCLE is None:
             print("❌ No GEMINI_API_KEY found in environment")
             print("   Please set GEMINI_API_KEY in your .env file")
             print("   Get your API key from: https://aistudio.google.com/app/apikey")
             return False
         
         # Handle multiple keys
-        if ',' in gemini_key_env:
-            keys = [key.strip() for key in gemini_key_env.split(',') if key.strip()]
-            print(f"   Found {len(keys)} API keys to test")
-            api_key = random.choice(keys)
-            print(f"   Testing random key: {api_key[:20]}...")
-        else:
-            api_key = gemini_key_env
-            print(f"   Testing key: {api_key[:20]}...")
+        api_key = next(_KEY_CYCLE)
+        if len(_KEYS) > 1:
+            print(f"   Found {len(_KEYS)} API keys to test")
+        print(f"   Testing key: {api_key[:20]}...")
+        if not _GEMINI_KEY_RE.match(api_key):
+            print("❌ Key format invalid (Gemini keys look like AIza... and are 39 characters)")
+            return False
         
         # Configure and test
         genai.configure(api_key=api_key)
         model = genai.GenerativeModel('gemini-1.5-pro')
         
-        # Simple test
-        response = model.generate_content("Say hello in one word")
+        # Simple test (the SDK call blocks, so keep it off the event loop)
+        response = await asyncio.to_thread(model.generate_content, "Say hello in one word")
         print(f"✅ Gemini API works! Response: {response.text.strip()}")
         return True
         
@@ -50,17 +64,12 @@ def test_gemini_api():
         print(f"❌ Gemini API test failed: {e}")
         return False
 
-def test_elevenlabs_api():
-    """Test ElevenLabs API key"""
+async def check_elevenlabs_api(session):
+    """Test ElevenLabs API key using the shared HTTP session"""
     print("\nTesting ElevenLabs API...")
     
     try:
-        import requests
-        
-        # Load environment variables
-        load_dotenv()
-        
-        api_key = os.getenv("ELEVENLABS_API_KEY")
+        api_key = ELEVEN_KEY
         if not api_key:
             print("❌ No ELEVENLABS_API_KEY found in environment")
             print("   Please set ELEVENLABS_API_KEY in your .env file")
@@ -68,42 +77,45 @@ def test_elevenlabs_api():
             return False
         
         print(f"   Testing key: {api_key[:20]}...")
+        if not _ELEVEN_KEY_RE.match(api_key):
+            print("⚠️ Key format unexpected (usually a hex key, optionally prefixed with sk_); checking with the API anyway")
         
         # Test API with a simple request
-        headers = {
-            "Accept": "application/json",
-            "xi-api-key": api_key
-        }
-        
-        response = requests.get("https://api.elevenlabs.io/v1/user", headers=headers)
-        
-        if response.status_code == 200:
-            user_data = response.json()
-            print(f"✅ ElevenLabs API works! User: {user_data.get('email', 'Unknown')}")
-            return True
-        else:
-            print(f"❌ ElevenLabs API test failed: {response.status_code} - {response.text}")
-            return False
+        async with session.get("https://api.elevenlabs.io/v1/user", headers={"xi-api-key": api_key}) as response:
+            if response.status == 200:
+                user_data = await response.json()
+                print(f"✅ ElevenLabs API works! User: {user_data.get('email', 'Unknown')}")
+                return True
+            else:
+                print(f"❌ ElevenLabs API test failed: {response.status} - {await response.text()}")
+                return False
             
     except Exception as e:
         print(f"❌ ElevenLabs API test failed: {e}")
         return False
 
-def main():
+async def main():
     """Main test function"""
     print("🔍 Testing API Keys for TheoremExplainAgent\n")
     
     # Check if .env file exists
-    if not os.path.exists('.env'):
+    if not exists('.env'):
         print("❌ No .env file found!")
         print("   Please create a .env file based on .env.template")
         print("   Run: cp .env.template .env")
         return
     
-    gemini_ok = test_gemini_api()
-    elevenlabs_ok = test_elevenlabs_api()
+    # One pooled session for all HTTP checks; the two services are
+    # independent, so check them concurrently
+    async with aiohttp.ClientSession(
+        headers={"Accept": "application/json"},
+        timeout=aiohttp.ClientTimeout(total=10)
+    ) as session:
+        gemini_ok, elevenlabs_ok = await asyncio.gather(
+            check_gemini_api(), check_elevenlabs_api(session)
+        )
     
-    print("\n" + "="*50)
+    print("\n" + SEP50)
     if gemini_ok and elevenlabs_ok:
         print("✅ All API keys are working correctly!")
         print("   You can now run generate_video.py")
@@ -118,4 +130,11 @@ def main():
         print("   Please check your .env file and API keys")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    runner = asyncio.run
+    try:
+        import uvloop
+        runner = uvloop.run
+    except ImportError:
+        pass
+    runner(main())
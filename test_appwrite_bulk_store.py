@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AppwriteVideoManager.bulk_store_error_fixes.
+
+The Appwrite SDK is replaced by an in-memory stub, so no credentials or
+network access are needed:
+
+    pytest test_appwrite_bulk_store.py
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.core import appwrite_integration
+from src.core.appwrite_integration import AppwriteVideoManager
+
+class StubDatabases:
+    """agent_memory documents kept in a dict; creates fail for fail_hashes."""
+
+    def __init__(self):
+        self.documents = {}
+        self.fail_hashes = set()
+        self.creates = []
+        self.updates = []
+
+    def list_documents(self, database_id, collection_id, queries):
+        filters = dict(q for q in queries if q is not None)
+        return {"documents": [doc for doc in self.documents.values()
+                              if all(doc.get(k) == v for k, v in filters.items())]}
+
+    def create_document(self, database_id, collection_id, document_id, data):
+        if data["error_hash"] in self.fail_hashes:
+            raise RuntimeError("create failed")
+        self.creates.append(data["error_hash"])
+        self.documents[document_id] = {"$id": document_id, **data}
+
+    def update_document(self, database_id, collection_id, document_id, data):
+        self.updates.append(self.documents[document_id]["error_hash"])
+        self.documents[document_id].update(data)
+
+@pytest.fixture
+def stub_sdk(monkeypatch):
+    """Stand in for the appwrite ID and Query helpers used by the manager."""
+    ids = iter(range(1_000_000))
+    monkeypatch.setattr(appwrite_integration, "ID", SimpleNamespace(unique=lambda: f"doc{next(ids)}"))
+    monkeypatch.setattr(appwrite_integration, "Query", SimpleNamespace(
+        limit=lambda n: None,
+        order_desc=lambda field: None,
+        equal=lambda field, value: (field, value),
+    ))
+
+def make_manager(databases):
+    """Enabled manager wired to the stub databases, skipping client setup."""
+    manager = AppwriteVideoManager.__new__(AppwriteVideoManager)
+    manager.enabled = True
+    manager.databases = databases
+    manager._executor = ThreadPoolExecutor(max_workers=4)
+    manager.database_id = "video_metadata"
+    manager.agent_memory_collection_id = "agent_memory"
+    return manager
+
+def fix(error_message, original_code="scene.add_animation(circle)"):
+    return dict(error_message=error_message, original_code=original_code,
+                fixed_code="scene.play(circle.animate)", topic="manim_basics")
+
+def test_repeated_error_updates_one_pattern(stub_sdk):
+    databases = StubDatabases()
+    manager = make_manager(databases)
+    fixes = [fix("NameError: foo"), fix("TypeError: bar"), fix("NameError: foo")]
+
+    assert asyncio.run(manager.bulk_store_error_fixes(fixes)) == [True, True, True]
+
+    # The two identical fixes share a hash: one create, then one update
+    repeated = manager._create_error_hash(fixes[0]["error_message"], fixes[0]["original_code"])
+    assert databases.creates.count(repeated) == 1
+    assert databases.updates == [repeated]
+    assert len(databases.documents) == 2
+    stored = next(doc for doc in databases.documents.values() if doc["error_hash"] == repeated)
+    assert stored["success_count"] == 2
+
+def test_failed_group_reports_false_per_item(stub_sdk):
+    fixes = [fix("NameError: foo"), fix("TypeError: bar"), fix("TypeError: bar"), fix("KeyError: baz")]
+    databases = StubDatabases()
+    manager = make_manager(databases)
+    # Both TypeError fixes fall in the group whose create call fails
+    databases.fail_hashes.add(manager._create_error_hash(fixes[1]["error_message"], fixes[1]["original_code"]))
+
+    assert asyncio.run(manager.bulk_store_error_fixes(fixes)) == [True, False, False, True]
+    assert len(databases.documents) == 2
+
+def test_disabled_manager_stores_nothing(stub_sdk):
+    databases = StubDatabases()
+    manager = make_manager(databases)
+    manager.enabled = False
+
+    assert asyncio.run(manager.bulk_store_error_fixes([fix("NameError: foo")])) == [False]
+    assert databases.documents == {}
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -8,60 +8,71 @@ setup and migration functionality.
 import asyncio
 import os
 import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 
+from _fs_util import exists
+
+# Test output goes through a queue so concurrently running tests don't
+# contend on stdout; the listener thread does the actual writes
+log = logging.getLogger("tests")
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue = queue.Queue(-1)
+log.addHandler(QueueHandler(_log_queue))
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _stdout_handler)
+
+def _flush_log():
+    """Block until the listener thread has written every queued log line."""
+    _log_queue.join()
+
+SEP50, SEP60 = "=" * 50, "=" * 60
+CONCURRENT_TEST_TIMEOUT = 60  # seconds allowed for the concurrent test batch
+
 # Load environment variables
 load_dotenv()
 
 # Add src to path for imports
 sys.path.append('src')
 
-async def test_appwrite_setup():
+async def check_appwrite_setup(manager):
     """Test Appwrite database and storage setup."""
-    print("🧪 Testing Appwrite Integration Setup")
-    print("=" * 50)
+    log.info("🧪 Testing Appwrite Integration Setup")
+    log.info(SEP50)
     
     try:
-        from src.core.appwrite_integration import AppwriteVideoManager
-        
-        # Initialize Appwrite manager
-        print("1. Initializing Appwrite manager...")
-        manager = AppwriteVideoManager()
-        
+        log.info("1. Checking Appwrite manager...")
         if not manager.enabled:
-            print("❌ Appwrite not enabled. Check your credentials.")
+            log.info("❌ Appwrite not enabled. Check your credentials.")
             return False
         
-        print("✅ Appwrite manager initialized")
+        log.info("✅ Appwrite manager initialized")
         
         # Setup database structure
-        print("\n2. Setting up database structure...")
+        log.info("\n2. Setting up database structure...")
         setup_success = await manager.setup_database_structure()
         
         if setup_success:
-            print("✅ Database structure setup completed")
+            log.info("✅ Database structure setup completed")
         else:
-            print("❌ Database setup failed")
+            log.info("❌ Database setup failed")
             return False
         
         return True
         
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("Make sure appwrite-sdk is installed: pip install appwrite")
-        return False
     except Exception as e:
-        print(f"❌ Setup failed: {e}")
+        log.info(f"❌ Setup failed: {e}")
         return False
 
-async def test_video_management():
+async def check_video_management(manager):
     """Test video record management."""
-    print("\n3. Testing Video Management...")
+    log.info("\n3. Testing Video Management...")
     
     try:
-        from src.core.appwrite_integration import AppwriteVideoManager
-        
-        manager = AppwriteVideoManager()
         if not manager.enabled:
             return False
         
@@ -74,51 +85,52 @@ async def test_video_management():
         )
         
         if video_id:
-            print(f"✅ Created test video: {video_id}")
+            log.info(f"✅ Created test video: {video_id}")
             
             # Update video status
             await manager.update_video_status(video_id, "planning")
-            print("✅ Updated video status")
+            log.info("✅ Updated video status")
             
             # Get video record
             video_record = await manager.get_video_record(video_id)
             if video_record:
-                print(f"✅ Retrieved video record: {video_record['topic']}")
+                log.info(f"✅ Retrieved video record: {video_record['topic']}")
             
-            # Create test scenes
-            for i in range(1, 4):
-                scene_id = await manager.create_scene_record(
+            # Create test scenes concurrently
+            scene_ids = await asyncio.gather(*[
+                manager.create_scene_record(
                     video_id=video_id,
                     scene_number=i,
                     scene_plan=f"Scene {i} plan",
                     storyboard=f"Scene {i} storyboard"
                 )
-                
+                for i in range(1, 4)
+            ])
+            
+            for i, scene_id in enumerate(scene_ids, start=1):
                 if scene_id:
-                    print(f"✅ Created scene {i}: {scene_id}")
+                    log.info(f"✅ Created scene {i}: {scene_id}")
             
             # Get video scenes
             scenes = await manager.get_video_scenes(video_id)
-            print(f"✅ Retrieved {len(scenes)} scenes for video")
+            log.info(f"✅ Retrieved {len(scenes)} scenes for video")
             
             return True
         else:
-            print("❌ Failed to create test video")
+            log.info("❌ Failed to create test video")
             return False
             
     except Exception as e:
-        print(f"❌ Video management test failed: {e}")
+        log.info(f"❌ Video management test failed: {e}")
         return False
 
-async def test_agent_memory():
+async def check_agent_memory(manager):
     """Test agent memory functionality."""
-    print("\n4. Testing Agent Memory...")
+    log.info("\n4. Testing Agent Memory...")
     
     try:
-        from src.core.appwrite_integration import AppwriteVideoManager
         from src.core.appwrite_agent_memory import AppwriteAgentMemory
         
-        manager = AppwriteVideoManager()
         if not manager.enabled:
             return False
         
@@ -135,7 +147,7 @@ async def test_agent_memory():
         )
         
         if success:
-            print("✅ Stored test error-fix pattern")
+            log.info("✅ Stored test error-fix pattern")
         
         # Search for similar fixes
         similar_fixes = await memory.search_similar_fixes(
@@ -145,96 +157,87 @@ async def test_agent_memory():
             scene_type="animation"
         )
         
-        print(f"✅ Found {len(similar_fixes)} similar fixes")
+        log.info(f"✅ Found {len(similar_fixes)} similar fixes")
         
         # Get memory statistics
         stats = await memory.get_memory_stats()
-        print(f"✅ Memory stats: {stats}")
+        log.info(f"✅ Memory stats: {stats}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Agent memory test failed: {e}")
+        log.info(f"❌ Agent memory test failed: {e}")
         return False
 
-async def test_migration():
+async def check_migration(manager):
     """Test migration of existing data."""
-    print("\n5. Testing Data Migration...")
+    log.info("\n5. Testing Data Migration...")
     
     try:
-        from src.core.appwrite_integration import AppwriteVideoManager
-        
-        manager = AppwriteVideoManager()
         if not manager.enabled:
             return False
         
         # Test migration if output directory exists
         output_dir = "output"
-        if os.path.exists(output_dir):
-            print(f"Found existing output directory: {output_dir}")
+        if exists(output_dir):
+            log.info(f"Found existing output directory: {output_dir}")
             
-            # Count existing data
-            video_count = 0
-            for item in os.listdir(output_dir):
-                if os.path.isdir(os.path.join(output_dir, item)):
-                    video_count += 1
+            # Count existing data (DirEntry.is_dir() avoids a stat per entry)
+            with os.scandir(output_dir) as entries:
+                video_count = sum(1 for entry in entries if entry.is_dir())
             
-            print(f"Found {video_count} potential videos to migrate")
+            log.info(f"Found {video_count} potential videos to migrate")
             
             if video_count > 0:
-                # Ask user if they want to migrate
+                # Ask user if they want to migrate; flush first so the
+                # prompt isn't printed ahead of the queued status lines
+                _flush_log()
                 response = input("Would you like to migrate existing data? (y/N): ")
                 if response.lower() == 'y':
                     success = await manager.migrate_existing_data(output_dir)
                     if success:
-                        print("✅ Migration completed successfully")
+                        log.info("✅ Migration completed successfully")
                     else:
-                        print("❌ Migration failed")
+                        log.info("❌ Migration failed")
                 else:
-                    print("Migration skipped")
+                    log.info("Migration skipped")
             else:
-                print("No data to migrate")
+                log.info("No data to migrate")
         else:
-            print("No output directory found - skipping migration test")
+            log.info("No output directory found - skipping migration test")
         
         return True
         
     except Exception as e:
-        print(f"❌ Migration test failed: {e}")
+        log.info(f"❌ Migration test failed: {e}")
         return False
 
-async def test_statistics():
+async def check_statistics(manager):
     """Test statistics and analytics."""
-    print("\n6. Testing Statistics...")
+    log.info("\n6. Testing Statistics...")
     
     try:
-        from src.core.appwrite_integration import AppwriteVideoManager
-        
-        manager = AppwriteVideoManager()
         if not manager.enabled:
             return False
         
         # Get video statistics
         stats = await manager.get_video_statistics()
         
-        print("📊 Video Statistics:")
+        log.info("📊 Video Statistics:")
         for key, value in stats.items():
-            print(f"   {key}: {value}")
+            log.info(f"   {key}: {value}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Statistics test failed: {e}")
+        log.info(f"❌ Statistics test failed: {e}")
         return False
 
-async def test_file_management():
+async def check_file_management(manager):
     """Test file upload functionality."""
-    print("\n7. Testing File Management...")
+    log.info("\n7. Testing File Management...")
     
     try:
-        from src.core.appwrite_integration import AppwriteVideoManager
-        
-        manager = AppwriteVideoManager()
         if not manager.enabled:
             return False
         
@@ -248,72 +251,113 @@ async def test_file_management():
             file_id = await manager.upload_source_code(test_file, "test_scene_id")
             
             if file_id:
-                print(f"✅ Uploaded test file: {file_id}")
+                log.info(f"✅ Uploaded test file: {file_id}")
                 
                 # Get file URL
                 file_url = manager._get_file_url(manager.source_code_bucket_id, file_id)
-                print(f"✅ File URL: {file_url}")
+                log.info(f"✅ File URL: {file_url}")
             else:
-                print("❌ File upload failed")
+                log.info("❌ File upload failed")
                 
         finally:
             # Clean up test file
-            if os.path.exists(test_file):
+            if exists(test_file):
                 os.remove(test_file)
         
         return True
         
     except Exception as e:
-        print(f"❌ File management test failed: {e}")
+        log.info(f"❌ File management test failed: {e}")
         return False
 
+# Checks that only need the database to exist and can run side by side
+CONCURRENT_CHECKS = (check_video_management, check_agent_memory,
+                     check_statistics, check_file_management)
+
 async def main():
     """Run all tests."""
-    print("🚀 Appwrite Video Metadata Management System Test Suite")
-    print("=" * 60)
+    log.info("🚀 Appwrite Video Metadata Management System Test Suite")
+    log.info(SEP60)
     
     # Check environment variables
     required_env_vars = ['APPWRITE_API_KEY', 'APPWRITE_PROJECT_ID']
-    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+    env = os.environ
+    missing_vars = [var for var in required_env_vars if not env.get(var)]
     
     if missing_vars:
-        print(f"❌ Missing environment variables: {', '.join(missing_vars)}")
-        print("Please set these in your .env file:")
-        print("APPWRITE_API_KEY=your_api_key_here")
-        print("APPWRITE_PROJECT_ID=your_project_id_here")
-        print("APPWRITE_ENDPOINT=https://cloud.appwrite.io/v1  # optional")
+        log.info(f"❌ Missing environment variables: {', '.join(missing_vars)}")
+        log.info("Please set these in your .env file:")
+        log.info("APPWRITE_API_KEY=your_api_key_here")
+        log.info("APPWRITE_PROJECT_ID=your_project_id_here")
+        log.info("APPWRITE_ENDPOINT=https://cloud.appwrite.io/v1  # optional")
+        return
+    
+    try:
+        from src.core.appwrite_integration import AppwriteVideoManager
+    except ImportError as e:
+        log.info(f"❌ Import error: {e}")
+        log.info("Make sure appwrite-sdk is installed: pip install appwrite")
         return
     
-    tests = [
-        test_appwrite_setup,
-        test_video_management,
-        test_agent_memory,
-        test_migration,
-        test_statistics,
-        test_file_management
-    ]
+    # One manager (and SDK client) shared by every test
+    manager = AppwriteVideoManager()
     
     passed = 0
-    total = len(tests)
+    total = 2 + len(CONCURRENT_CHECKS)  # setup + concurrent batch + migration
     
-    for test in tests:
-        try:
-            result = await test()
-            if result:
-                passed += 1
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
+    # Setup runs first - the other tests need the database to exist
+    try:
+        if await check_appwrite_setup(manager):
+            passed += 1
+    except Exception as e:
+        log.info(f"❌ Test failed with exception: {e}")
     
-    print(f"\n🎯 Test Results: {passed}/{total} tests passed")
+    # The remaining network-bound tests are independent, so run them
+    # concurrently; a hung API call cancels the batch instead of stalling it
+    tasks = []
+    try:
+        async with asyncio.timeout(CONCURRENT_TEST_TIMEOUT), asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(check(manager))
+                for check in CONCURRENT_CHECKS
+            ]
+    except TimeoutError:
+        log.info(f"❌ Tests timed out after {CONCURRENT_TEST_TIMEOUT}s")
+    except Exception as e:
+        log.info(f"❌ Test failed with exception: {e}")
+    
+    for task in tasks:
+        if task.done() and not task.cancelled() and task.exception() is None and task.result():
+            passed += 1
+    
+    # Migration prompts for input, so keep it out of the concurrent batch
+    try:
+        if await check_migration(manager):
+            passed += 1
+    except Exception as e:
+        log.info(f"❌ Test failed with exception: {e}")
+    
+    log.info(f"\n🎯 Test Results: {passed}/{total} tests passed")
     
     if passed == total:
-        print("🎉 All tests passed! Appwrite integration is working correctly.")
-        print("\nNext steps:")
-        print("1. Update your video generation code to use AppwriteVideoManager")
-        print("2. Replace AgentMemory with AppwriteAgentMemory")
-        print("3. Use the migration function to move existing data")
+        log.info("🎉 All tests passed! Appwrite integration is working correctly.")
+        log.info("\nNext steps:")
+        log.info("1. Update your video generation code to use AppwriteVideoManager")
+        log.info("2. Replace AgentMemory with AppwriteAgentMemory")
+        log.info("3. Use the migration function to move existing data")
     else:
-        print("⚠️ Some tests failed. Please check the error messages above.")
+        log.info("⚠️ Some tests failed. Please check the error messages above.")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    runner = asyncio.run
+    try:
+        import uvloop
+        runner = uvloop.run
+    except ImportError:
+        pass
+    _log_listener.start()
+    try:
+        runner(main())
+    finally:
+        _log_listener.stop()
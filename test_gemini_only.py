@@ -1,18 +1,18 @@
 import os
 from dotenv import load_dotenv
 import google.generativeai as genai
-import random
+import itertools
 
 load_dotenv()
 
-gemini_key_env = os.getenv('GEMINI_API_KEY')
-if ',' in gemini_key_env:
-    keys = [key.strip() for key in gemini_key_env.split(',') if key.strip()]
-    api_key = random.choice(keys)
-    print(f"Selected random key: {api_key[:20]}...")
-else:
-    api_key = gemini_key_env
-    print(f"Using single key: {api_key[:20]}...")
+# Comma-separated keys are parsed once and handed out round-robin
+_KEYS = [key.strip() for key in (os.getenv('GEMINI_API_KEY') or '').split(',') if key.strip()]
+_KEY_CYCLE = itertools.cycle(_KEYS) if _KEYS else None
+if _KEY_CYCLE is None:
+    raise SystemExit("GEMINI_API_KEY is not set")
+
+api_key = next(_KEY_CYCLE)
+print(f"Using key {api_key[:20]}... ({len(_KEYS)} configured)")
 
 genai.configure(api_key=api_key)
 model = genai.GenerativeModel('gemini-1.5-pro')
@@ -9,12 +9,16 @@ example provided by the user.
 
 import os
 import sys
+import logging
 from src.utils.tavily_search import TavilyErrorSearchEngine, search_error_solution
 
+SEP50, SEP60, SEP65 = "=" * 50, "=" * 60, "=" * 65
+DASH50 = "-" * 50
+
 def test_user_example_error():
     """Test the exact error example provided by the user"""
     print("🎯 Testing User-Provided Error Example")
-    print("="*60)
+    print(SEP60)
     
     # The exact error from the user
     user_error = """
@@ -33,10 +37,10 @@ triangle = Polygon([(0, 0, 0), (2, 0, 0), (2, 1.5, 0)], stroke_width=2)
     print()
     
     # Test improved query generation
-    engine = TavilyErrorSearchEngine(verbose=True)
+    engine = TavilyErrorSearchEngine()
     
     print("🔍 **Testing Improved Query Generation:**")
-    print("-" * 50)
+    print(DASH50)
     
     analysis = engine.analyze_error_for_search(user_error, code_context)
     
@@ -55,13 +59,11 @@ triangle = Polygon([(0, 0, 0), (2, 0, 0), (2, 1.5, 0)], stroke_width=2)
         "site:docs.manim.community"
     ]
     
-    query = analysis.search_query
-    matches = []
-    for element in expected_elements:
-        if element.lower() in query.lower():
-            matches.append(f"✅ {element}")
-        else:
-            matches.append(f"❌ {element}")
+    query_lower = analysis.search_query.lower()
+    matches = [
+        ("✅ " if element.lower() in query_lower else "❌ ") + element
+        for element in expected_elements
+    ]
     
     print("🎯 **Query Validation:**")
     for match in matches:
@@ -72,7 +74,7 @@ triangle = Polygon([(0, 0, 0), (2, 0, 0), (2, 1.5, 0)], stroke_width=2)
 def test_various_error_types():
     """Test query generation for different types of Manim errors"""
     print("\n🧪 **Testing Various Error Types**")
-    print("="*50)
+    print(SEP50)
     
     test_cases = [
         {
@@ -110,23 +112,27 @@ AttributeError: 'Text' object has no attribute 'set_font_size'
         }
     ]
     
-    engine = TavilyErrorSearchEngine(verbose=False)  # Quiet for bulk testing
+    engine = TavilyErrorSearchEngine()
+    analyses = engine.analyze_batch([(case["traceback"], case["code"]) for case in test_cases])
     
-    for i, case in enumerate(test_cases, 1):
+    for i, (case, analysis) in enumerate(zip(test_cases, analyses), 1):
         print(f"📋 **Test Case {i}: {case['name']}**")
         
-        analysis = engine.analyze_error_for_search(case["traceback"], case["code"])
-        
-        print(f"   Generated Query: {analysis.search_query}")
-        print(f"   Expected Object: {case['expected_object']}")
-        print(f"   Found Object: {'✅' if case['expected_object'].lower() in analysis.search_query.lower() else '❌'}")
-        print(f"   Has site:docs.manim.community: {'✅' if 'site:docs.manim.community' in analysis.search_query else '❌'}")
-        print()
+        query = analysis.search_query
+        found_object = case["expected_object"].lower() in query.lower()
+        has_site = "site:docs.manim.community" in query
+        print("\n".join((
+            "   Generated Query: " + query,
+            "   Expected Object: " + case["expected_object"],
+            "   Found Object: " + ("✅" if found_object else "❌"),
+            "   Has site:docs.manim.community: " + ("✅" if has_site else "❌"),
+            ""
+        )))
 
 def test_query_format_comparison():
     """Compare old vs new query format"""
     print("📊 **Query Format Comparison**")
-    print("="*50)
+    print(SEP50)
     
     sample_error = """
 ValueError: all the input arrays must have same number of dimensions, but the 
@@ -158,7 +164,7 @@ array at index 0 has 2 dimension(s) and the array at index 1 has 3 dimension(s)
 def main():
     """Run the test"""
     print("🎬 Improved Documentation-Targeted Query Generation Test")
-    print("="*65)
+    print(SEP65)
     
     # Test user's specific example
     analysis = test_user_example_error()
@@ -180,4 +186,5 @@ def main():
     print("   Polygon dimension errors instead of random forum discussions!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     main() 
\ No newline at end of file
@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
 """
 Test script to verify Memvid integration is working correctly.
+
+Run with pytest; the tests are independent, so they can be spread across
+worker processes with pytest-xdist:
+
+    pytest -n auto test_memvid_integration.py
 """
 
 import os
 import sys
+import importlib.util
+
+import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from _fs_util import stat_or_none
+from _output_util import buffered_stdout
+
+@buffered_stdout()
 def test_memvid_import():
     """Test if memvid can be imported successfully."""
     print("🔍 Testing Memvid import...")
@@ -16,11 +28,10 @@ def test_memvid_import():
     try:
         from src.rag.memvid_integration import MemvidRAGIntegration, get_memvid_integration
         print("✅ Memvid integration module imported successfully")
-        return True
     except ImportError as e:
-        print(f"❌ Failed to import memvid integration: {e}")
-        return False
+        pytest.fail(f"❌ Failed to import memvid integration: {e}")
 
+@buffered_stdout()
 def test_memvid_dependencies():
     """Test if memvid dependencies are available."""
     print("\n🔍 Testing Memvid dependencies...")
@@ -35,17 +46,18 @@ def test_memvid_dependencies():
         ('google-generativeai', 'google.generativeai')
     ]
     
-    all_available = True
+    # find_spec only locates the package; it doesn't run cv2/torch init code
+    missing = []
     for pkg_name, import_name in dependencies:
-        try:
-            __import__(import_name)
+        if importlib.util.find_spec(import_name) is not None:
             print(f"✅ {pkg_name} is available")
-        except ImportError:
+        else:
             print(f"❌ {pkg_name} is missing")
-            all_available = False
+            missing.append(pkg_name)
     
-    return all_available
+    assert not missing, f"Missing dependencies: {', '.join(missing)}"
 
+@buffered_stdout()
 def test_memvid_files():
     """Test if memvid memory files exist."""
     print("\n🔍 Testing Memvid memory files...")
@@ -58,103 +70,53 @@ def test_memvid_files():
     
     all_exist = True
     for file_path in files:
-        if os.path.exists(file_path):
-            size = os.path.getsize(file_path)
-            print(f"✅ {file_path} exists ({size:,} bytes)")
+        # One stat per file gives both existence and size
+        st = stat_or_none(file_path)
+        if st is not None:
+            print(f"✅ {file_path} exists ({st.st_size:,} bytes)")
         else:
             print(f"❌ {file_path} is missing")
             all_exist = False
     
-    return all_exist
+    assert all_exist, "Memvid memory files are missing"
 
-def test_memvid_initialization():
+@buffered_stdout()
+def test_memvid_initialization(memvid_rag):
     """Test if memvid integration can be initialized."""
     print("\n🔍 Testing Memvid initialization...")
     
-    try:
-        from src.rag.memvid_integration import get_memvid_integration
-        
-        memvid_rag = get_memvid_integration(
-            video_file="manim_memory.mp4",
-            index_file="manim_memory_index.json"
-        )
-        
-        if memvid_rag and memvid_rag.is_available():
-            stats = memvid_rag.get_stats()
-            print(f"✅ Memvid initialized successfully")
-            print(f"   📊 Stats: {stats}")
-            return True
-        else:
-            print("❌ Memvid initialization failed - not available")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Memvid initialization failed: {e}")
-        return False
+    assert memvid_rag and memvid_rag.is_available(), "❌ Memvid initialization failed - not available"
+    
+    stats = memvid_rag.get_stats()
+    print(f"✅ Memvid initialized successfully")
+    print(f"   📊 Stats: {stats}")
 
-def test_code_generator_memvid():
+@buffered_stdout()
+def test_code_generator_memvid(memvid_rag):
     """Test if CodeGenerator can use memvid."""
     print("\n🔍 Testing CodeGenerator with Memvid...")
     
-    try:
-        from src.core.code_generator import CodeGenerator
-        from mllm_tools.litellm import LiteLLMWrapper
-        
-        # Create a minimal model for testing
-        model = LiteLLMWrapper("gemini/gemini-2.5-flash-latest")
-        
-        # Initialize CodeGenerator with memvid enabled
-        code_gen = CodeGenerator(
-            scene_model=model,
-            helper_model=model,
-            output_dir="test_output",
-            use_memvid=True,
-            memvid_video_file="manim_memory.mp4",
-            memvid_index_file="manim_memory_index.json"
-        )
-        
-        if hasattr(code_gen, 'memvid_rag') and code_gen.memvid_rag:
-            print("✅ CodeGenerator successfully initialized with Memvid")
-            return True
-        else:
-            print("❌ CodeGenerator failed to initialize Memvid")
-            return False
-            
-    except Exception as e:
-        print(f"❌ CodeGenerator memvid test failed: {e}")
-        return False
-
-def main():
-    """Run all memvid integration tests."""
-    print("🧪 Memvid Integration Test Suite")
-    print("=" * 50)
-    
-    tests = [
-        test_memvid_import,
-        test_memvid_dependencies,
-        test_memvid_files,
-        test_memvid_initialization,
-        test_code_generator_memvid
-    ]
+    if not (memvid_rag and memvid_rag.is_available()):
+        pytest.skip("Memvid is not available")
     
-    passed = 0
-    total = len(tests)
+    from src.core.code_generator import CodeGenerator
+    from mllm_tools.litellm import LiteLLMWrapper
     
-    for test in tests:
-        if test():
-            passed += 1
-        print()
+    # Create a minimal model for testing
+    model = LiteLLMWrapper("gemini/gemini-2.5-flash-latest")
     
-    print("=" * 50)
-    print(f"🎯 Test Results: {passed}/{total} tests passed")
+    # Initialize CodeGenerator with memvid enabled
+    code_gen = CodeGenerator(
+        scene_model=model,
+        helper_model=model,
+        output_dir="test_output",
+        use_memvid=True,
+        memvid_video_file="manim_memory.mp4",
+        memvid_index_file="manim_memory_index.json"
+    )
     
-    if passed == total:
-        print("🎉 All tests passed! Memvid integration is working correctly.")
-        return True
-    else:
-        print("❌ Some tests failed. Check the output above for details.")
-        return False
+    assert getattr(code_gen, 'memvid_rag', None), "❌ CodeGenerator failed to initialize Memvid"
+    print("✅ CodeGenerator successfully initialized with Memvid")
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
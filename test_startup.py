@@ -5,66 +5,77 @@ Test script to verify app startup for HF Spaces debugging
 
 import os
 import sys
+import json
+import itertools
+import subprocess
+import importlib.util
 
+from _output_util import buffered_stdout
+
+MAX_LISTED_FILES = 50
+APP_PROBE_TIMEOUT = 30  # seconds allowed for the app import probe
+
+# Child-process probe: import the app, call the startup helpers and report
+# their results on a single marker line (app setup prints its own output too)
+_RESULT_MARKER = "__APP_PROBE__ "
+_APP_PROBE = (
+    "import json\n"
+    "from app import check_dependencies, setup_environment\n"
+    "dep_result = check_dependencies()\n"
+    "env_result = setup_environment()\n"
+    f"print({_RESULT_MARKER!r} + json.dumps([dep_result, env_result], default=str))\n"
+)
+
+@buffered_stdout()
 def test_imports():
     """Test all required imports."""
     print("🧪 Testing imports...")
     
-    try:
-        import gradio as gr
-        print("✅ Gradio imported successfully")
-    except ImportError as e:
-        print(f"❌ Gradio import failed: {e}")
-        return False
-    
-    try:
-        import requests
-        print("✅ Requests imported successfully")
-    except ImportError as e:
-        print(f"❌ Requests import failed: {e}")
-        return False
-    
-    try:
-        import numpy as np
-        print("✅ NumPy imported successfully")
-    except ImportError as e:
-        print(f"❌ NumPy import failed: {e}")
-        return False
-    
-    try:
-        import pandas as pd
-        print("✅ Pandas imported successfully")
-    except ImportError as e:
-        print(f"❌ Pandas import failed: {e}")
-        return False
+    # Presence check only - the real gradio import happens in test_gradio_basic
+    for module_name, label in (("gradio", "Gradio"), ("requests", "Requests"),
+                               ("numpy", "NumPy"), ("pandas", "Pandas")):
+        if importlib.util.find_spec(module_name) is None:
+            print(f"❌ {label} import failed: No module named '{module_name}'")
+            return False
+        print(f"✅ {label} is available")
     
     return True
 
+@buffered_stdout()
 def test_app_functions():
     """Test app functions without launching."""
     print("🧪 Testing app functions...")
     
+    # Import the app in a child process so its heavy imports (gradio, the
+    # agent stack) stay out of this process and a crash at import time
+    # can't take the test runner down with it
     try:
-        # Import app functions
-        sys.path.insert(0, '.')
-        from app import check_dependencies, setup_environment
-        
-        print("✅ App imports successful")
-        
-        # Test dependency check
-        dep_result = check_dependencies()
-        print(f"📦 Dependencies: {dep_result}")
-        
-        # Test environment setup
-        env_result = setup_environment()
-        print(f"🔧 Environment: {env_result}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ App function test failed: {e}")
+        proc = subprocess.run(
+            [sys.executable, "-c", _APP_PROBE],
+            capture_output=True, text=True, timeout=APP_PROBE_TIMEOUT,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+    except subprocess.TimeoutExpired:
+        print(f"❌ App function test failed: timed out after {APP_PROBE_TIMEOUT}s")
+        return False
+    
+    for line in proc.stdout.splitlines():
+        if line.startswith(_RESULT_MARKER):
+            dep_result, env_result = json.loads(line[len(_RESULT_MARKER):])
+            break
+    else:
+        lines = proc.stderr.strip().splitlines()
+        detail = lines[-1] if lines else f"exit code {proc.returncode}"
+        print(f"❌ App function test failed: {detail}")
         return False
+    
+    print("✅ App imports successful")
+    print(f"📦 Dependencies: {dep_result}")
+    print(f"🔧 Environment: {env_result}")
+    
+    return True
 
+@buffered_stdout()
 def test_gradio_basic():
     """Test basic Gradio functionality."""
     print("🧪 Testing Gradio basic functionality...")
@@ -94,7 +105,11 @@ def main():
     print("🚀 Starting HF Spaces compatibility tests...")
     print(f"🐍 Python version: {sys.version}")
     print(f"📂 Current directory: {os.getcwd()}")
-    print(f"📁 Files in directory: {os.listdir('.')}")
+    # Only the first few entries are useful for debugging; stop reading there
+    with os.scandir('.') as entries:
+        files = [entry.name for entry in itertools.islice(entries, MAX_LISTED_FILES + 1)]
+    more = "..." if len(files) > MAX_LISTED_FILES else ""
+    print(f"📁 Files in directory: {files[:MAX_LISTED_FILES]}{more}")
     
     # Test imports
     if not test_imports():
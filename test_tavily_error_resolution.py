@@ -8,88 +8,113 @@ generate optimal search queries for Manim errors.
 
 import os
 import sys
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from _output_util import buffered_stdout
 from src.utils.tavily_search import TavilyErrorSearchEngine, search_error_solution
 
-def test_gemini_query_generation():
-    """Test Gemini-based search query generation"""
-    print("🧪 Testing Gemini-powered Search Query Generation\n")
-    
-    # Initialize Tavily engine
-    engine = TavilyErrorSearchEngine(verbose=True)
-    
-    # Test cases - common Manim errors
-    test_cases = [
-        {
-            "name": "get_side_length AttributeError",
-            "traceback": """
+# API keys are read once at import
+GEMINI_KEY = os.getenv('GEMINI_API_KEY')
+TAVILY_KEY = os.getenv('TAVILY_API_KEY')
+
+# Test cases - common Manim errors, built once at import
+TEST_CASES = (
+    {
+        "name": "get_side_length AttributeError",
+        "traceback": """
 Traceback (most recent call last):
   File "scene.py", line 62, in construct
     a = triangle.get_side_length(0)
 TypeError: Mobject.__getattr__.<locals>.getter() takes 1 positional argument but 2 were given
             """,
-            "code_context": "triangle = Polygon([-2, -1, 0], [2, -1, 0], [2, 1, 0])\na = triangle.get_side_length(0)"
-        },
-        {
-            "name": "Angle constructor error", 
-            "traceback": """
+        "code_context": "triangle = Polygon([-2, -1, 0], [2, -1, 0], [2, 1, 0])\na = triangle.get_side_length(0)"
+    },
+    {
+        "name": "Angle constructor error", 
+        "traceback": """
 Traceback (most recent call last):
   File "scene.py", line 71, in construct
     angle = Angle(triangle.get_vertices()[0], triangle.get_vertices()[1], triangle.get_vertices()[2], radius=0.5)
 TypeError: Angle.__init__() got multiple values for argument 'radius'
             """,
-            "code_context": "angle = Angle(triangle.get_vertices()[0], triangle.get_vertices()[1], triangle.get_vertices()[2], radius=0.5)"
-        },
-        {
-            "name": "Point constructor error",
-            "traceback": """
+        "code_context": "angle = Angle(triangle.get_vertices()[0], triangle.get_vertices()[1], triangle.get_vertices()[2], radius=0.5)"
+    },
+    {
+        "name": "Point constructor error",
+        "traceback": """
 Traceback (most recent call last):
   File "scene.py", line 65, in construct  
     triangle = Polygon(Point(-2, -1, 0), Point(2, -1, 0), Point(2, 1, 0))
 TypeError: Point.__init__() takes from 1 to 3 positional arguments but 4 were given
             """,
-            "code_context": "triangle = Polygon(Point(-2, -1, 0), Point(2, -1, 0), Point(2, 1, 0))"
-        }
-    ]
+        "code_context": "triangle = Polygon(Point(-2, -1, 0), Point(2, -1, 0), Point(2, 1, 0))"
+    }
+)
+
+@functools.lru_cache(maxsize=1)
+def get_engine():
+    """Shared TavilyErrorSearchEngine for every test in this script"""
+    return TavilyErrorSearchEngine()
+
+def run_case(i, test_case, engine):
+    """Analyze and search one test case, returning its report as text"""
+    lines = [f"📋 Test Case {i}: {test_case['name']}", "=" * 50]
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"📋 Test Case {i}: {test_case['name']}")
-        print("=" * 50)
+    try:
+        # Analyze error and generate search query with Gemini
+        analysis = engine.analyze_error_for_search(
+            test_case["traceback"], 
+            test_case["code_context"]
+        )
         
-        try:
-            # Analyze error and generate search query with Gemini
-            analysis = engine.analyze_error_for_search(
-                test_case["traceback"], 
-                test_case["code_context"]
-            )
-            
-            print(f"✅ Generated Query: {analysis.search_query}")
-            print(f"📏 Query Length: {len(analysis.search_query)} chars")
-            print(f"🔍 Error Type: {analysis.error_type}")
-            print(f"🧩 Key Components: {analysis.key_components}")
+        lines.append(f"✅ Generated Query: {analysis.search_query}")
+        lines.append(f"📏 Query Length: {len(analysis.search_query)} chars")
+        lines.append(f"🔍 Error Type: {analysis.error_type}")
+        lines.append(f"🧩 Key Components: {analysis.key_components}")
+        
+        # Test Tavily search with generated query
+        if engine.is_available():
+            lines.append("\n🌐 Testing Tavily search...")
+            search_results = engine.search_for_solution(analysis)
             
-            # Test Tavily search with generated query
-            if engine.is_available():
-                print("\n🌐 Testing Tavily search...")
-                search_results = engine.search_for_solution(analysis)
+            if search_results.get("available", False):
+                solutions = search_results.get("solutions", [])
+                lines.append(f"📊 Found {len(solutions)} solutions")
                 
-                if search_results.get("available", False):
-                    solutions = search_results.get("solutions", [])
-                    print(f"📊 Found {len(solutions)} solutions")
-                    
-                    for j, solution in enumerate(solutions[:2], 1):
-                        print(f"   {j}. {solution.get('title', 'No title')}")
-                        print(f"      Source: {solution.get('source_type', 'unknown')}")
-                        print(f"      Score: {solution.get('relevance_score', 0):.2f}")
-                else:
-                    print("❌ Tavily search failed")
+                for j, solution in enumerate(solutions[:2], 1):
+                    lines.append(f"   {j}. {solution.get('title', 'No title')}")
+                    lines.append(f"      Source: {solution.get('source_type', 'unknown')}")
+                    lines.append(f"      Score: {solution.get('relevance_score', 0):.2f}")
             else:
-                print("⚠️ Tavily not available - testing query generation only")
-                
-        except Exception as e:
-            print(f"❌ Test failed: {e}")
-        
-        print("\n" + "="*50 + "\n")
+                lines.append("❌ Tavily search failed")
+        else:
+            lines.append("⚠️ Tavily not available - testing query generation only")
+            
+    except Exception as e:
+        lines.append(f"❌ Test failed: {e}")
+    
+    lines.append("\n" + "="*50 + "\n")
+    return "\n".join(lines)
+
+@buffered_stdout()
+def test_gemini_query_generation():
+    """Test Gemini-based search query generation"""
+    print("🧪 Testing Gemini-powered Search Query Generation\n")
+    
+    engine = get_engine()
+    
+    # Cases are independent network round-trips, so run them concurrently and
+    # print each report in the original order
+    with ThreadPoolExecutor(max_workers=len(TEST_CASES)) as executor:
+        futures = [
+            executor.submit(run_case, i, test_case, engine)
+            for i, test_case in enumerate(TEST_CASES, 1)
+        ]
+        for future in futures:
+            print(future.result())
 
+@buffered_stdout()
 def test_complete_workflow():
     """Test the complete error resolution workflow"""
     print("🔄 Testing Complete Error Resolution Workflow\n")
@@ -125,12 +150,13 @@ a = triangle.get_side_length(0)  # This line causes the error
     except Exception as e:
         print(f"❌ Workflow test failed: {e}")
 
+@buffered_stdout()
 def test_api_keys():
     """Test API key availability"""
     print("🔑 Testing API Key Configuration\n")
     
-    gemini_key = os.getenv('GEMINI_API_KEY')
-    tavily_key = os.getenv('TAVILY_API_KEY')
+    gemini_key = GEMINI_KEY
+    tavily_key = TAVILY_KEY
     
     print(f"Gemini API Key: {'✅ Available' if gemini_key else '❌ Missing'}")
     print(f"Tavily API Key: {'✅ Available' if tavily_key else '❌ Missing'}")
@@ -169,4 +195,5 @@ def main():
     print("- Error resolution now adapts to any Manim error pattern")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     main() 
\ No newline at end of file
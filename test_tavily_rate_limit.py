@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Tavily engine's rate-limit retry handling.
+
+The Tavily client is replaced by a stub callable, so no API key or network
+access is needed:
+
+    pytest test_tavily_rate_limit.py
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.utils import tavily_search
+from src.utils.tavily_search import TavilyErrorSearchEngine, UsageLimitExceededError
+
+class StubMethod:
+    """Client method that raises the queued errors in order, then returns "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+@pytest.fixture
+def engine():
+    # A high request rate keeps the pacing delay out of the way
+    return TavilyErrorSearchEngine(api_key="test", rate_per_min=1e9, max_retries=3)
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested sleeps instead of actually sleeping."""
+    recorded = []
+    monkeypatch.setattr(tavily_search.time, "sleep", recorded.append)
+    return recorded
+
+def test_client_rate_limit_error_is_retried(engine, sleeps):
+    method = StubMethod(UsageLimitExceededError("rate limited"), UsageLimitExceededError("rate limited"))
+
+    assert engine._rate_limited_call(method, query="q") == "ok"
+    assert method.calls == 3
+    # No Retry-After available, so the backoff is 2 ** attempt seconds
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(1.0, abs=0.1)
+    assert sleeps[1] == pytest.approx(2.0, abs=0.1)
+
+def test_retry_after_header_is_honoured(engine, sleeps):
+    error = Exception("429")
+    error.response = SimpleNamespace(status_code=429, headers={"Retry-After": "5"})
+    method = StubMethod(error)
+
+    assert engine._rate_limited_call(method) == "ok"
+    assert method.calls == 2
+    assert sleeps[0] == pytest.approx(5.0, abs=0.1)
+
+def test_rate_limit_gives_up_after_max_retries(engine, sleeps):
+    method = StubMethod(*(UsageLimitExceededError("rate limited") for _ in range(4)))
+
+    with pytest.raises(UsageLimitExceededError):
+        engine._rate_limited_call(method)
+    assert method.calls == 4
+
+def test_other_errors_are_not_retried(engine, sleeps):
+    method = StubMethod(ValueError("bad query"))
+
+    with pytest.raises(ValueError):
+        engine._rate_limited_call(method)
+    assert method.calls == 1
+    assert sleeps == []
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -8,8 +8,27 @@ from exactly the top 3 URLs, prioritized by source type and relevance.
 
 import os
 import sys
+import socket
 from src.utils.tavily_search import TavilyErrorSearchEngine, search_error_solution
 
+TAVILY_HOST = ("api.tavily.com", 443)
+_tavily_reachable_cache = None
+
+def _tavily_reachable():
+    """Return True if the Tavily API accepts a TCP connection.
+    
+    Checked once per process with a short timeout, so an offline run fails
+    fast instead of waiting on every per-URL request to time out.
+    """
+    global _tavily_reachable_cache
+    if _tavily_reachable_cache is None:
+        try:
+            socket.create_connection(TAVILY_HOST, timeout=0.5).close()
+            _tavily_reachable_cache = True
+        except OSError:
+            _tavily_reachable_cache = False
+    return _tavily_reachable_cache
+
 def test_top_3_extraction():
     """Test that only top 3 URLs get content extracted"""
     print("🎯 Testing TOP 3 URL Content Extraction")
@@ -31,6 +50,10 @@ triangle = Polygon([(0, 0, 0), (2, 0, 0), (2, 1.5, 0)], stroke_width=2)
     print("   Priority: docs.manim.community > GitHub > Stack Overflow")
     print()
     
+    if not _tavily_reachable():
+        print("⚠️ api.tavily.com is unreachable - skipping extraction test")
+        return
+    
     try:
         # Run error resolution with content extraction
         result = search_error_solution(
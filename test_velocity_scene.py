@@ -1,19 +1,44 @@
+from functools import lru_cache
+
 from manim import *
 
+# Layout offsets, computed once rather than on every helper/updater call
+_SHIFT_DOWN2 = DOWN * 2
+_CORNER_OFFSET = DOWN * 0.5 + RIGHT * 0.5
+_AXES_OFFSET = DOWN * 0.5 + LEFT * 0.5
+
+@lru_cache(maxsize=256)
+def _time_tex(tenths):
+    """Clock label for a time in tenths of a second, typeset once per value.
+
+    Returns a shared prototype; callers must copy it before positioning.
+    """
+    return Tex(f"Time: {tenths / 10:.1f} s")
+
+# Prototype mobjects, built once per distinct set of constructor arguments.
+# Callers always take a .copy() so the cached originals are never moved.
+@lru_cache(maxsize=None)
+def _number_line_proto(x_range, length):
+    return NumberLine(x_range=list(x_range), length=length, include_numbers=True)
+
+@lru_cache(maxsize=None)
+def _axes_proto(x_range, y_range, x_length, y_length):
+    return Axes(x_range=list(x_range), y_range=list(y_range), x_length=x_length, y_length=y_length)
+
+@lru_cache(maxsize=None)
+def _math_tex_proto(tex):
+    return MathTex(tex)
+
 class Scene1_Helper:
     def __init__(self, scene):
         self.scene = scene
 
     def create_x_axis(self):
-        x_axis = NumberLine(
-            x_range=[-1, 10, 1],
-            length=10,
-            include_numbers=True
-        ).shift(DOWN * 2)
+        x_axis = _number_line_proto((-1, 10, 1), 10).copy().shift(_SHIFT_DOWN2)
         return x_axis
 
     def create_x_label(self, x_axis):
-        x_label = MathTex("x").next_to(x_axis, RIGHT, buff=0.3)
+        x_label = _math_tex_proto("x").copy().next_to(x_axis, RIGHT, buff=0.3)
         return x_label
 
     def create_ball(self, x_axis):
@@ -21,21 +46,16 @@ class Scene1_Helper:
         return ball
 
     def create_clock(self):
-        clock = Tex("Time: 0.0 s").to_corner(UL).shift(DOWN*0.5 + RIGHT*0.5)
+        clock = _time_tex(0).copy().to_corner(UL).shift(_CORNER_OFFSET)
         return clock
 
     def create_axes(self):
-        axes = Axes(
-            x_range=[0, 10, 1],
-            y_range=[0, 10, 1],
-            x_length=4,
-            y_length=4
-        ).to_corner(UR).shift(DOWN*0.5 + LEFT*0.5)
+        axes = _axes_proto((0, 10, 1), (0, 10, 1), 4, 4).copy().to_corner(UR).shift(_AXES_OFFSET)
         return axes
 
     def create_axes_labels(self, axes):
-        x_axis_label = axes.get_x_axis_label("t")
-        y_axis_label = axes.get_y_axis_label("x")
+        x_axis_label = axes.get_x_axis_label(_math_tex_proto("t").copy())
+        y_axis_label = axes.get_y_axis_label(_math_tex_proto("x").copy())
         return x_axis_label, y_axis_label
 
 class Scene1(MovingCameraScene):
@@ -55,6 +75,9 @@ class Scene1(MovingCameraScene):
         self.wait(0.3)
 
         clock = helper.create_clock()
+        # Every clock label shares this top-left corner; capture it once so
+        # the updater doesn't redo the corner/shift layout each frame
+        clock_corner = clock.get_corner(UL)
         self.play(FadeIn(clock), run_time=1)
         self.wait(0.3)
 
@@ -67,19 +90,26 @@ class Scene1(MovingCameraScene):
         def position_function(t):
             return t  # Example: constant velocity of 1 unit/second
 
-        graph = axes.plot(position_function, x_range=[0, 0], color=RED)
+        # Sample the full curve once (in a single vectorized call, since
+        # position_function is plain arithmetic on NumPy arrays); each frame
+        # reveals a prefix of it in place instead of re-plotting the graph
+        full_graph = axes.plot(position_function, x_range=[0, 8], use_vectorized=True, color=RED)
+        graph = full_graph.copy()
+        graph.pointwise_become_partial(full_graph, 0, 0)
+
+        # x(t) = t, so the ball's number-line position is just the elapsed time
+        n2p = x_axis.n2p
 
         def update_ball_position(mob, alpha):
-            new_x = x_axis.n2p(position_function(alpha * 8)) #Move ball to x = function(t)
-            mob.move_to(new_x)
+            mob.move_to(n2p(alpha * 8.0))
 
         def update_graph(mob, alpha):
-            new_graph = axes.plot(position_function, x_range=[0, alpha*8], color=RED)
-            mob.become(new_graph)
+            mob.pointwise_become_partial(full_graph, 0, alpha)
 
         def update_time(mob, alpha):
-            time = alpha * 8
-            mob.become(Tex(f"Time: {time:.1f} s").to_corner(UL).shift(DOWN*0.5 + RIGHT*0.5))
+            # The label only changes every 0.1 s, so most frames hit the cache
+            tenths = round(alpha * 8 * 10)
+            mob.become(_time_tex(tenths).copy().move_to(clock_corner, aligned_edge=UL))
 
         self.play(
             UpdateFromAlphaFunc(ball, update_ball_position),
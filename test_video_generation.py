@@ -3,11 +3,21 @@
 Test Script for Video Generation with Appwrite Integration
 
 This script tests the complete video generation pipeline with the new Appwrite database integration.
+
+Run with pytest (needs pytest-asyncio); the tests are independent, so they
+can be spread across worker processes with pytest-xdist:
+
+    pytest -n auto test_video_generation.py
 """
 
 import asyncio
+import contextlib
+import functools
+import importlib
 import os
 import sys
+
+import pytest
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,50 +27,139 @@ load_dotenv()
 sys.path.append('src')
 
 from src.config.config import Config
+from _output_util import buffered_stdout_async
+
+# Every test here is a coroutine
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture(scope="module", autouse=True)
+def _warmup():
+    """Import the generation stack once, before any test starts.
+    
+    Keeps the one-off manim/litellm import cost out of the first test's
+    duration so per-test timings (pytest --durations) compare steady-state
+    work. Skipped without GEMINI_API_KEY, since only the generation test
+    needs these modules and it skips in that case.
+    """
+    if not os.getenv("GEMINI_API_KEY"):
+        return
+    for module_name in ("generate_video", "mllm_tools.litellm"):
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass  # reported by the test that needs the module
+
+# Similar-fix search results for this test session, keyed by query
+# arguments; _BatchedWriter clears it whenever it writes new fixes
+_fix_search_cache = {}
+
+async def _search_similar_fixes_cached(memory, **kwargs):
+    """memory.search_similar_fixes, memoized for the rest of the session."""
+    key = tuple(sorted(kwargs.items()))
+    if key not in _fix_search_cache:
+        _fix_search_cache[key] = await memory.search_similar_fixes(**kwargs)
+    return _fix_search_cache[key]
+
+class _BatchedWriter:
+    """Queue error-fix writes and store them in bulk from a background task.
+    
+    submit() returns as soon as the fix is queued; the worker drains up to
+    batch_size queued fixes per memory.store_error_fixes call. Must be
+    created inside a running event loop.
+    """
+    
+    def __init__(self, memory, batch_size: int = 20):
+        self._memory = memory
+        self._batch_size = batch_size
+        self._queue = asyncio.Queue()
+        self._results = []
+        self._task = asyncio.create_task(self._run())
+    
+    async def submit(self, **fix):
+        """Queue one fix (store_error_fix keyword arguments)."""
+        await self._queue.put(fix)
+    
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                self._results.extend(await self._memory.store_error_fixes(batch))
+            except Exception as e:
+                print(f"⚠️ Batched error-fix write failed: {e}")
+                self._results.extend([False] * len(batch))
+            finally:
+                # Cached searches may predate the fixes just written
+                _fix_search_cache.clear()
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def flush(self):
+        """Wait for every queued fix to be written; return all success flags so far."""
+        await self._queue.join()
+        return list(self._results)
+    
+    async def close(self):
+        """Flush pending writes and stop the worker task."""
+        await self.flush()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
 
+@functools.lru_cache(maxsize=1)
+def _get_planner():
+    """Planner model shared by every test that needs one (built on first use)."""
+    from mllm_tools.litellm import LiteLLMWrapper
+    
+    return LiteLLMWrapper(
+        model_name=Config.DEFAULT_PLANNER_MODEL,
+        temperature=Config.DEFAULT_MODEL_TEMPERATURE,
+        print_cost=Config.MODEL_PRINT_COST,
+        verbose=Config.MODEL_VERBOSE,
+        use_langfuse=Config.USE_LANGFUSE
+    )
+
+@functools.lru_cache(maxsize=2)
+def _get_generator(use_appwrite: bool):
+    """VideoGenerator built once per Appwrite setting and reused across tests."""
+    from generate_video import VideoGenerator
+    
+    planner_model = _get_planner()
+    return VideoGenerator(
+        planner_model=planner_model,
+        helper_model=planner_model,
+        scene_model=planner_model,
+        output_dir="output",
+        use_rag=False,
+        use_context_learning=False,
+        use_visual_fix_code=False,
+        verbose=True,
+        use_appwrite=use_appwrite
+    )
+
+@buffered_stdout_async
 async def test_video_generation_with_appwrite():
     """Test video generation with Appwrite metadata management."""
     print("🧪 Testing Video Generation with Appwrite Integration")
     print("=" * 60)
     
+    # Check for Gemini API key before paying for the generate_video/manim imports
+    if not os.getenv("GEMINI_API_KEY"):
+        pytest.skip("❌ No GEMINI_API_KEY found in environment")
+    
     try:
-        # Import required modules
-        from generate_video import VideoGenerator
-        from mllm_tools.litellm import LiteLLMWrapper
-        
         print("1. Initializing AI models...")
         
-        # Check for Gemini API key
-        gemini_keys = os.getenv("GEMINI_API_KEY", "")
-        if not gemini_keys:
-            print("❌ No GEMINI_API_KEY found in environment")
-            return False
-            
         # Initialize models
-        planner_model = LiteLLMWrapper(
-            model_name=Config.DEFAULT_PLANNER_MODEL,
-            temperature=Config.DEFAULT_MODEL_TEMPERATURE,
-            print_cost=Config.MODEL_PRINT_COST,
-            verbose=Config.MODEL_VERBOSE,
-            use_langfuse=Config.USE_LANGFUSE
-        )
+        _get_planner()
         
         print("✅ AI models initialized")
         
         print("\n2. Initializing Video Generator with Appwrite...")
         
         # Initialize video generator with Appwrite enabled
-        video_generator = VideoGenerator(
-            planner_model=planner_model,
-            helper_model=planner_model,
-            scene_model=planner_model,
-            output_dir="output",
-            use_rag=False,
-            use_context_learning=False,
-            use_visual_fix_code=False,
-            verbose=True,
-            use_appwrite=True  # Enable Appwrite integration
-        )
+        video_generator = _get_generator(use_appwrite=True)
         
         print("✅ Video Generator with Appwrite integration initialized")
         
@@ -83,49 +182,49 @@ async def test_video_generation_with_appwrite():
         print("\n4. Checking database records...")
         
         if video_generator.use_appwrite and video_generator.appwrite_manager:
-            # Get video statistics
-            stats = await video_generator.appwrite_manager.get_video_statistics()
+            # Statistics and the recent-video listing are independent queries,
+            # so issue both round-trips at once
+            manager = video_generator.appwrite_manager
+            stats, videos = await asyncio.gather(
+                manager.get_video_statistics(),
+                manager.list_videos(limit=3)
+            )
             print(f"📊 Database Statistics:")
             print(f"   - Planning videos: {stats.get('planning_videos', 0)}")
             print(f"   - Total scenes: {stats.get('total_scenes', 0)}")
             print(f"   - Memory patterns: {stats.get('memory_patterns', 0)}")
             
             # List recent videos
-            videos = await video_generator.appwrite_manager.list_videos(limit=3)
             print(f"📝 Recent videos: {len(videos)} found")
             for video in videos:
                 print(f"   - {video.get('topic', 'Unknown')} (Status: {video.get('status', 'Unknown')})")
         
         print("\n✅ Appwrite database integration test completed successfully!")
-        return True
         
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("Make sure all dependencies are installed")
-        return False
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
+        pytest.fail(f"❌ Import error: {e} - make sure all dependencies are installed")
 
+@buffered_stdout_async
 async def test_agent_memory_integration():
     """Test agent memory integration with video generation."""
     print("\n🧠 Testing Agent Memory Integration")
     print("=" * 40)
     
-    try:
-        from src.core.appwrite_integration import AppwriteVideoManager
-        from src.core.appwrite_agent_memory import AppwriteAgentMemory
-        
-        # Initialize Appwrite components
-        manager = AppwriteVideoManager()
-        if not manager.enabled:
-            print("❌ Appwrite not available")
-            return False
-            
-        memory = AppwriteAgentMemory(manager)
+    from src.core.appwrite_integration import AppwriteVideoManager
+    from src.core.appwrite_agent_memory import AppwriteAgentMemory
+    
+    # Initialize Appwrite components
+    manager = AppwriteVideoManager()
+    if not manager.enabled:
+        pytest.skip("❌ Appwrite not available")
         
-        # Test storing a common Manim error pattern
-        success = await memory.store_error_fix(
+    memory = AppwriteAgentMemory(manager)
+    
+    # Test storing a common Manim error pattern; writes go through the
+    # batched writer and are flushed before searching for them
+    writer = _BatchedWriter(memory)
+    try:
+        await writer.submit(
             error_message="AttributeError: 'Scene' object has no attribute 'add_animation'",
             original_code="scene.add_animation(circle.shift(UP))",
             fixed_code="scene.play(circle.animate.shift(UP))",
@@ -133,60 +232,28 @@ async def test_agent_memory_integration():
             scene_type="animation",
             fix_method="llm"
         )
-        
-        if success:
-            print("✅ Stored error-fix pattern successfully")
-        else:
-            print("⚠️ Failed to store error-fix pattern")
-            
-        # Test retrieving similar patterns
-        similar_fixes = await memory.search_similar_fixes(
-            error_message="Scene object error",
-            code_context="scene.add_animation",
-            topic="manim_basics"
-        )
-        
-        print(f"✅ Found {len(similar_fixes)} similar error patterns")
-        
-        # Test memory statistics
-        stats = await memory.get_memory_stats()
-        print(f"📊 Memory Statistics: {stats}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Agent memory test failed: {e}")
-        return False
-
-async def main():
-    """Run all tests."""
-    print("🚀 Video Generation + Appwrite Integration Test Suite")
-    print("=" * 70)
-    
-    # Test 1: Video generation with Appwrite
-    test1_result = await test_video_generation_with_appwrite()
-    
-    # Test 2: Agent memory integration
-    test2_result = await test_agent_memory_integration()
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("📋 TEST SUMMARY")
-    print("=" * 70)
-    print(f"Video Generation + Appwrite: {'✅ PASS' if test1_result else '❌ FAIL'}")
-    print(f"Agent Memory Integration:     {'✅ PASS' if test2_result else '❌ FAIL'}")
-    
-    if test1_result and test2_result:
-        print("\n🎉 All tests passed! The Appwrite database integration is working correctly.")
-        print("\n💡 Key Features Verified:")
-        print("   ✅ Video metadata tracking in database")
-        print("   ✅ Scene planning and status management")
-        print("   ✅ Agent memory for error pattern learning")
-        print("   ✅ Structured data storage replacing text files")
+        success = all(await writer.flush())
+    finally:
+        await writer.close()
+    
+    if success:
+        print("✅ Stored error-fix pattern successfully")
     else:
-        print("\n⚠️  Some tests failed. Check the error messages above.")
+        print("⚠️ Failed to store error-fix pattern")
+        
+    # Test retrieving similar patterns
+    similar_fixes = await _search_similar_fixes_cached(
+        memory,
+        error_message="Scene object error",
+        code_context="scene.add_animation",
+        topic="manim_basics"
+    )
+    
+    print(f"✅ Found {len(similar_fixes)} similar error patterns")
     
-    return test1_result and test2_result
+    # Test memory statistics
+    stats = await memory.get_memory_stats()
+    print(f"📊 Memory Statistics: {stats}")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))